@@ -0,0 +1,12 @@
+#!/usr/bin/env bash
+
+set -e
+set -x
+
+# time the benchmark tests and save the run to .benchmarks; once a previous run is
+# saved, fail when a mean regresses by more than 20% against it
+compare=()
+if [ -d .benchmarks ]; then
+    compare=(--benchmark-compare --benchmark-compare-fail=mean:20%)
+fi
+uv run pytest -m benchmark --benchmark-min-rounds=20 --benchmark-autosave "${compare[@]}" $@
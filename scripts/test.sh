@@ -3,5 +3,8 @@
 set -e
 set -x
 
-uv run coverage run --source=atria_core -m pytest $@ 
+# --dist only takes effect with `-n`, and keeps each test file on a single worker so
+# session fixtures and payloads used by a file are built once per worker. Benchmarks
+# run once untimed as regular tests, scripts/bench.sh times them
+uv run coverage run --source=atria_core -m pytest --dist=loadfile --benchmark-disable $@ 
 uv run coverage report --show-missing
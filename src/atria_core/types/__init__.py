@@ -24,6 +24,7 @@ if TYPE_CHECKING:
         DatasetLabels,
         DatasetMetadata,
         DatasetShardInfo,
+        DatasetStorageInfo,
         SplitConfig,
         SplitInfo,
     )
@@ -62,6 +63,7 @@ __getattr__, __dir__, __all__ = lazy.attach(
             "DatasetLabels",
             "DatasetMetadata",
             "DatasetShardInfo",
+            "DatasetStorageInfo",
             "SplitConfig",
             "SplitInfo",
         ],
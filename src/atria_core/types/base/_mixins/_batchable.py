@@ -107,18 +107,116 @@ class Batchable(BaseModel):
             except Exception as e:
                 raise RuntimeError(f"Failed to batch field '{field_name}'") from e
 
+        return cls._construct_batched(
+            batched_fields, model_instances[0], len(model_instances)
+        )
+
+    def batched_repeat(self, batch_size: int) -> Self:
+        """
+        Create a batched instance holding `batch_size` copies of this instance.
+
+        The result matches `batched([self] * batch_size)`, but tensor fields are
+        expanded along a new batch dimension instead of being stacked, so the batch
+        is a view over this instance's tensors and no tensor data is copied. The
+        expanded tensors must not be modified in place.
+
+        Args:
+            batch_size: Number of copies in the batch.
+
+        Returns:
+            Self: A new batched instance containing the repeated data.
+
+        Raises:
+            ValueError: If the batch size is smaller than one.
+
+        Example:
+            ```python
+            batched_model = model.batched_repeat(3)
+            assert batched_model.batch_size == 3
+            ```
+        """
+        if batch_size < 1:
+            raise ValueError("Cannot batch fewer than one model instance")
+
+        batched_fields: dict[str, Any] = {}
+        for field_name in self.__class__.model_fields:
+            try:
+                batched_fields[field_name] = self._repeat_batch_field(
+                    field_name, getattr(self, field_name), batch_size
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to batch field '{field_name}'") from e
+
+        return self._construct_batched(batched_fields, self, batch_size)
+
+    @classmethod
+    def _construct_batched(
+        cls, batched_fields: dict[str, Any], template: Self, batch_size: int
+    ) -> Self:
+        """
+        Construct a batched instance from already batched field values.
+
+        Args:
+            batched_fields: Batched values for each field of the model.
+            template: Instance whose private attributes are copied to the batch.
+            batch_size: Number of instances in the batch.
+
+        Returns:
+            Self: The batched instance.
+        """
         # Create the batched instance and mark it as batched
         batched_instance = cls.model_construct(**batched_fields)
         for private_attr in batched_instance.__private_attributes__:
             setattr(
-                batched_instance,
-                private_attr,
-                getattr(model_instances[0], private_attr, None),
+                batched_instance, private_attr, getattr(template, private_attr, None)
             )
         batched_instance._is_batched = True
-        batched_instance._batch_size = len(model_instances)
+        batched_instance._batch_size = batch_size
         return batched_instance
 
+    @classmethod
+    def _repeat_batch_field(cls, field_name: str, value: Any, batch_size: int) -> Any:
+        """
+        Batch a field holding the same value for every instance in the batch.
+
+        This mirrors `_batch_field` for `batch_size` copies of a single value.
+
+        Args:
+            field_name: Name of the field being batched.
+            value: The value of this field in the repeated instance.
+            batch_size: Number of copies in the batch.
+
+        Returns:
+            Any: The batched value for this field.
+        """
+        from atria_core.types.typing.common import _is_tensor_type
+
+        if value is None:
+            return None
+
+        if cls._batch_skip_fields and field_name in cls._batch_skip_fields:
+            return None
+
+        # identical values are always merged into a single value
+        if cls._batch_merge_fields and field_name in cls._batch_merge_fields:
+            return value
+
+        if isinstance(value, Batchable):
+            return value.batched_repeat(batch_size)
+
+        if isinstance(value, list) and value and isinstance(value[0], Batchable):
+            return value[0].__class__.batched(value).batched_repeat(batch_size)
+
+        if _is_tensor_type(value):
+            if (
+                cls._batch_tensor_stack_skip_fields
+                and field_name in cls._batch_tensor_stack_skip_fields
+            ):
+                return [value] * batch_size
+            return value.unsqueeze(0).expand(batch_size, *value.shape)
+
+        return [value] * batch_size
+
     @classmethod
     def _batch_field(cls, field_name: str, values: list[Any]) -> Any:
         """
@@ -278,6 +278,35 @@ class TableSerializable(BaseModel):
         except Exception as e:
             raise RuntimeError(f"Failed to create {cls.__name__} from row") from e
 
+    def clone_via_arrow(self) -> Self:
+        """
+        Create a copy of this model instance by round-tripping its row through a
+        single-row PyArrow table with the model's `pa_schema`.
+
+        The row is built from a shallow clone, since `to_row` converts the instance it
+        is called on to its raw form, so this instance keeps its tensors. The copy is
+        in raw form and only holds the fields that are part of the table schema.
+
+        Returns:
+            Self: New model instance read back from the table
+
+        Example:
+            ```python
+            model = MyModel(name="John", age=30)
+            clone = model.clone_via_arrow()
+            ```
+        """
+        try:
+            import pyarrow as pa
+
+            row = self.shallow_clone().to_row()
+            table = pa.Table.from_pylist([row], schema=self.pa_schema())
+            return self.from_row(table.to_pylist()[0])
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to clone {self.__class__.__name__} through arrow"
+            ) from e
+
     @classmethod
     def clear_schema_cache(cls) -> None:
         """Clear all cached schema data for this class."""
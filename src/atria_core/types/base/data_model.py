@@ -1,5 +1,7 @@
 import types
-from typing import Any, Union, get_args, get_origin
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any, Self, Union, get_args, get_origin
 
 from pydantic import BaseModel, ConfigDict
 
@@ -14,6 +16,10 @@ from atria_core.utilities.repr import RepresentationMixin
 
 logger = get_logger(__name__)
 
+# deepcopy memo key under which `BaseDataModel.__deepcopy__` records the models whose
+# tensors were already seeded into the memo by an enclosing model
+_SEEDED_MODELS_MEMO_KEY = object()
+
 
 class PydanticBase(RepresentationMixin, BaseModel):  # type: ignore[misc]
     pass
@@ -44,6 +50,72 @@ class BaseDataModel(  # type: ignore[misc]
             self.__dict__[name] = value
             self.__pydantic_fields_set__.add(name)
 
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        """
+        Deep copies the model. Tensors in its fields, in list fields and in nested
+        models are copied with `Tensor.clone` instead of `Tensor.__deepcopy__`, which
+        is several times slower for small tensors. Only dense tensors that are the
+        sole view of their whole storage within the copied model are cloned, since
+        cloning would materialize expanded views and split storage shared between
+        fields. Other tensors (e.g. sparse ones), and tensors that require gradients,
+        keep the default behaviour.
+        """
+        memo = {} if memo is None else memo
+        seeded_models = memo.setdefault(id(_SEEDED_MODELS_MEMO_KEY), set())
+        if id(self) not in seeded_models:
+            self._seed_deepcopy_memo(memo, seeded_models)
+        return super().__deepcopy__(memo)
+
+    def _iter_deepcopy_tensors(self, models: set[int]) -> Iterator[Any]:
+        """Yields the tensors of this and nested models, recording each visited model."""
+        from atria_core.types.typing.common import _is_tensor_type
+
+        models.add(id(self))
+        for value in self.__dict__.values():
+            for item in value if isinstance(value, list) else (value,):
+                if isinstance(item, BaseDataModel):
+                    yield from item._iter_deepcopy_tensors(models)
+                elif _is_tensor_type(item):
+                    yield item
+
+    def _seed_deepcopy_memo(self, memo: dict[int, Any], models: set[int]) -> None:
+        """Seeds the deepcopy memo with clones of the tensors that can be cloned."""
+        tensors = list(self._iter_deepcopy_tensors(models))
+        if not tensors:
+            return
+
+        import torch
+
+        # only strided tensors have a storage to compare
+        tensors = [tensor for tensor in tensors if tensor.layout is torch.strided]
+        storage_counts = Counter(
+            tensor.untyped_storage().data_ptr() for tensor in tensors
+        )
+        for tensor in tensors:
+            storage = tensor.untyped_storage()
+            if (
+                not tensor.requires_grad
+                and id(tensor) not in memo
+                and storage_counts[storage.data_ptr()] == 1
+                and tensor.is_contiguous()
+                and storage.nbytes() == tensor.numel() * tensor.element_size()
+            ):
+                memo[id(tensor)] = tensor.detach().clone()
+
+    def shallow_clone(self) -> Self:
+        """
+        Returns a copy of the model that shares its field values with this instance but
+        holds its own copies of any nested data models. Loading and tensor/device
+        conversions reassign fields instead of modifying them in place, so the clone
+        can be converted independently without copying the content buffers as
+        `copy.deepcopy` would.
+        """
+        clone = self.model_copy()
+        for name, value in clone.__dict__.items():
+            if isinstance(value, BaseDataModel):
+                clone.__dict__[name] = value.shallow_clone()
+        return clone
+
     @classmethod
     def _get_types(cls, field_annotation: Any) -> list[type]:
         """Extract non-None types from a field annotation."""
@@ -211,6 +211,37 @@ class ImageFactory(factory.Factory):
         kwargs.pop("_image_size", None)
         return model_class(*args, **kwargs)
 
+    @classmethod
+    def build_batch_of_sizes(
+        cls, sizes: list[tuple[int, int]], **kwargs
+    ) -> list[Image]:
+        """
+        Builds one tensor image for each (width, height) in `sizes`. The pixels of all
+        images are drawn in a single uint8 numpy allocation, each image then converts
+        its own crop to a contiguous float tensor, so no image keeps the padded batch
+        alive.
+        """
+        import numpy as np
+        import torch
+
+        max_width = max(width for width, _ in sizes)
+        max_height = max(height for _, height in sizes)
+        pixels = torch.from_numpy(
+            np.random.randint(
+                0, 256, (len(sizes), 3, max_height, max_width), dtype=np.uint8
+            )
+        )
+        return [
+            cls.build(
+                _backend="torch",
+                content=pixels[i, :, :height, :width]
+                .to(torch.float32, memory_format=torch.contiguous_format)
+                .div_(255),
+                **kwargs,
+            )
+            for i, (width, height) in enumerate(sizes)
+        ]
+
     @classmethod
     def _create(cls, model_class, *args, **kwargs):
         kwargs.pop("_backend", None)
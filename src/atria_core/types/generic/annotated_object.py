@@ -58,7 +58,7 @@ class AnnotatedObjectList(BaseDataModel):
     segmentation: Annotated[
         list[list[list[float]]] | None,
         _tensor_validator(3),
-        TableSchemaMetadata(pa_type="list<list<float64>>"),
+        TableSchemaMetadata(pa_type="list<list<list<float64>>>"),
     ] = None
     iscrowd: ListBoolField
 
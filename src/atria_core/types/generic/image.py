@@ -40,8 +40,8 @@ class Image(BaseDataModel):
     def _validate_dims(self):
         if self.source_width is None or self.source_height is None:
             if self.content is not None:
-                self._set_skip_validation("source_width", self.content.size[0])
-                self._set_skip_validation("source_height", self.content.size[1])
+                self._set_skip_validation("source_width", self.size[0])
+                self._set_skip_validation("source_height", self.size[1])
             elif self.file_path is not None and Path(self.file_path).exists():
                 import imagesize
 
@@ -126,18 +126,20 @@ class Image(BaseDataModel):
     def _to_tensor(self) -> None:
         if self.content is not None and not _is_tensor_type(self.content):
             import torch
-            from torchvision.transforms.functional import to_tensor
+
+            from atria_core.utilities.tensors import _pil_image_to_tensor
 
             if self._is_batched:
                 assert isinstance(self.content, list) and len(self.content) > 0, (
                     "Expected a list of PIL Images for batched images."
                 )
+                tensors = [_pil_image_to_tensor(img) for img in self.content]
                 try:
-                    self.content = torch.stack([to_tensor(img) for img in self.content])
+                    self.content = torch.stack(tensors)
                 except Exception:
-                    self.content = [to_tensor(img) for img in self.content]
+                    self.content = tensors
             else:
-                self.content = to_tensor(self.content)
+                self.content = _pil_image_to_tensor(self.content)
 
     def _to_raw(self) -> None:
         if self.content is not None and _is_tensor_type(self.content):
@@ -6,7 +6,8 @@ It includes functionality for stacking tensors, converting various data types to
 and checking if a nested list contains tensors.
 
 Functions:
-    - _stack_tensors_if_possible: Attempts to stack a list of tensors into a single tensor.
+    - _pil_image_to_tensor: Converts a PIL image into a float tensor in [0, 1].
+    - _ndarray_to_tensor: Converts a numpy array into a tensor, sharing its buffer where possible.
     - _convert_to_tensor: Converts various data types (e.g., lists, numbers, ndarrays) into PyTorch tensors.
     - _is_nested_list_of_tensors: Checks if a nested list contains tensors.
 
@@ -22,7 +23,10 @@ License: MIT
 """
 
 import numbers
+import os
 from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import TYPE_CHECKING, Annotated, Any, Optional, Union, cast
 
 from atria_core.logger import get_logger
@@ -30,79 +34,436 @@ from atria_core.logger import get_logger
 from pydantic import AfterValidator
 
 if TYPE_CHECKING:
+    import numpy as np
     import torch
+    from PIL.Image import Image as PILImage
 
 logger = get_logger(__name__)
 
+# PIL modes that are stored as 8-bit channels and map directly onto a uint8 array
+_UINT8_PIL_MODES = {"L", "P", "LA", "RGB", "RGBA", "RGBX", "CMYK", "YCbCr", "HSV"}
 
-def _stack_tensors_if_possible(
-    tensors: list["torch.Tensor"],
-) -> Union["torch.Tensor", list["torch.Tensor"]]:
+# kinds of values `_convert_to_tensor` dispatches on, see `_value_kind`
+_KIND_LIST, _KIND_NUMBER, _KIND_TENSOR, _KIND_NDARRAY, _KIND_PIL_IMAGE, _KIND_OTHER = (
+    range(6)
+)
+_KIND_BY_TYPE: dict[type, int] = {}
+
+# batches of arrays at least this large are copied into their batch on a thread pool
+# of at most _MAX_COPY_WORKERS threads, each copying a contiguous chunk of rows
+_PARALLEL_COPY_MIN_BYTES = 8 * 1024 * 1024
+_MAX_COPY_WORKERS = 8
+
+
+def _pil_image_to_tensor(image: "PILImage") -> "torch.Tensor":
+    """
+    Converts a PIL image into a float tensor of shape (C, H, W) with values in [0, 1],
+    matching `torchvision.transforms.functional.to_tensor`. For 8-bit modes the pixels
+    are read through the numpy array interface directly as the default float dtype,
+    which avoids the intermediate uint8 copies made by torchvision.
+
+    Args:
+        image (PILImage): The PIL image to convert.
+
+    Returns:
+        torch.Tensor: The image tensor.
+    """
+    import numpy as np
+    import torch
+
+    # default dtypes numpy cannot represent (e.g. bfloat16) are left to torchvision
+    dtype = {
+        torch.float16: np.float16,
+        torch.float32: np.float32,
+        torch.float64: np.float64,
+    }.get(torch.get_default_dtype())
+    if image.mode not in _UINT8_PIL_MODES or dtype is None:
+        from torchvision.transforms.functional import to_tensor
+
+        return to_tensor(image)
+
+    array = np.asarray(image, dtype=dtype)
+    if array.ndim == 2:
+        array = array[..., None]
+    return torch.from_numpy(array).permute(2, 0, 1).contiguous().div_(255)
+
+
+@lru_cache(maxsize=1)
+def _from_numpy_typestrs() -> frozenset[str]:
+    """
+    Returns the numpy dtype strings (`__array_interface__` typestrs) in native byte
+    order that `torch.from_numpy` accepts.
+
+    Returns:
+        frozenset[str]: The supported dtype strings.
+    """
+    import numpy as np
+
+    return frozenset(
+        np.dtype(name).str
+        for name in (
+            "bool",
+            "uint8",
+            "int8",
+            "int16",
+            "int32",
+            "int64",
+            "float16",
+            "float32",
+            "float64",
+            "complex64",
+            "complex128",
+        )
+    )
+
+
+def _ndarray_to_tensor(array: "np.ndarray") -> "torch.Tensor":
+    """
+    Converts a numpy array into a tensor sharing its buffer where possible. Arrays
+    that are not C-contiguous are copied into a contiguous buffer first, read-only
+    arrays (e.g. read-only memory maps) are copied since torch cannot share them.
+
+    Args:
+        array (np.ndarray): The array to convert.
+
+    Returns:
+        torch.Tensor: The tensor view or copy of the array.
+    """
+    import numpy as np
+    import torch
+
+    if array.dtype.str not in _from_numpy_typestrs():
+        native_dtype = array.dtype.newbyteorder("=")
+        if native_dtype.str not in _from_numpy_typestrs():
+            raise TypeError(f"Cannot convert numpy array of dtype {array.dtype}")
+        # byte-swapped arrays are supported once converted to the native byte order
+        return torch.from_numpy(array.astype(native_dtype, order="C"))
+    if not array.flags.writeable:
+        return torch.from_numpy(np.array(array, order="C"))
+    # np.require keeps 0-d arrays 0-d, unlike np.ascontiguousarray
+    return torch.from_numpy(np.require(array, requirements="C"))
+
+
+def _warn_conversion_failed(value: Any, error: Exception) -> None:
+    logger.warning(
+        f"Failed to convert value {value} of type {type(value)} to tensor: {error}"
+    )
+
+
+def _classify_type(value_type: type) -> int:
+    """
+    Maps a type onto one of the `_KIND_*` tags used to dispatch conversions.
+
+    Args:
+        value_type (type): The type to classify.
+
+    Returns:
+        int: The kind tag of the type.
+    """
+    import numpy as np
+    import torch
+    from PIL.Image import Image as PILImage
+
+    if issubclass(value_type, list):
+        return _KIND_LIST
+    elif issubclass(value_type, numbers.Number):
+        return _KIND_NUMBER
+    elif issubclass(value_type, torch.Tensor):
+        return _KIND_TENSOR
+    elif issubclass(value_type, np.ndarray):
+        return _KIND_NDARRAY
+    elif issubclass(value_type, PILImage):
+        return _KIND_PIL_IMAGE
+    return _KIND_OTHER
+
+
+def _value_kind(value: Any) -> int:
+    """
+    Returns the kind tag of a value, classifying each type only once.
+
+    Args:
+        value (Any): The value to classify.
+
+    Returns:
+        int: The kind tag of the value.
+    """
+    value_type = type(value)
+    kind = _KIND_BY_TYPE.get(value_type)
+    if kind is None:
+        kind = _KIND_BY_TYPE[value_type] = _classify_type(value_type)
+    return kind
+
+
+def _python_scalar_dtype(value_type: type) -> Optional["torch.dtype"]:
+    """
+    Returns the dtype torch infers for a python int, float or bool, None otherwise.
+
+    Args:
+        value_type (type): The type of the scalar.
+
+    Returns:
+        torch.dtype | None: The dtype of the scalar type.
+    """
+    import torch
+
+    if value_type is int:
+        return torch.int64
+    elif value_type is float:
+        return torch.get_default_dtype()
+    elif value_type is bool:
+        return torch.bool
+    return None
+
+
+def _python_scalars_to_tensor(values: list, dtype: "torch.dtype") -> "torch.Tensor":
     """
-    Attempts to stack a list of tensors into a single tensor. If stacking is not possible,
-    returns the list of tensors as-is.
+    Creates a 1D tensor from a flat list of python scalars by writing them through the
+    numpy view of the tensor in one pass. Dtypes numpy cannot represent (e.g. a
+    bfloat16 default dtype) are created by `torch.tensor` instead.
 
     Args:
-        tensors (list["torch.Tensor"]): A list of PyTorch tensors to stack.
+        values (list): The scalars to convert.
+        dtype (torch.dtype): The dtype of the tensor.
 
     Returns:
-        torch.Tensor | list[torch.Tensor]: A stacked tensor if possible, otherwise the original list of tensors.
+        torch.Tensor: The tensor holding the scalars.
     """
     import torch
 
+    tensor = torch.empty(len(values), dtype=dtype)
+    try:
+        array = tensor.numpy()
+    except TypeError:
+        return torch.tensor(values, dtype=dtype)
+    array[:] = values
+    return tensor
+
+
+def _number_to_tensor(value: numbers.Number | list) -> "torch.Tensor":
+    import torch
+
+    # python scalars of a single type get their dtype resolved up front
+    if type(value) is list:
+        first_type = type(value[0]) if value else None
+        dtype = _python_scalar_dtype(first_type)
+        if dtype is not None and all(type(item) is first_type for item in value):
+            return _python_scalars_to_tensor(value, dtype)
+    else:
+        dtype = _python_scalar_dtype(type(value))
+        if dtype is not None:
+            return torch.tensor(value, dtype=dtype)
+    # other numbers are never shared, as_tensor only skips the copy semantics of
+    # torch.tensor and produces the same dtype
+    return torch.as_tensor(value)
+
+
+def _number_rows_to_tensor(
+    rows: list,
+) -> Union["torch.Tensor", list["torch.Tensor"], None]:
+    """
+    Converts a list of non-empty rows of python scalars of a single type with one
+    allocation. Rows of equal length are returned as a 2D view of it, ragged rows
+    as a list of 1D views split from it.
+
+    Args:
+        rows (list): The rows to convert.
+
+    Returns:
+        torch.Tensor | list[torch.Tensor] | None: The converted rows, or None if the
+            rows are not all non-empty lists of scalars of the same type.
+    """
+    if not all(type(row) is list and row for row in rows):
+        return None
+    first_type = type(rows[0][0])
+    dtype = _python_scalar_dtype(first_type)
+    if dtype is None:
+        return None
+    flat = [item for row in rows for item in row]
+    if not all(type(item) is first_type for item in flat):
+        return None
     try:
-        return torch.stack(tensors)
+        tensor = _python_scalars_to_tensor(flat, dtype)
+    except OverflowError:
+        return None
+    lengths = [len(row) for row in rows]
+    if all(length == lengths[0] for length in lengths):
+        return tensor.view(len(rows), lengths[0])
+    return list(tensor.split(lengths))
+
+
+def _tensor_list_to_tensor(
+    value: list["torch.Tensor"],
+) -> Union["torch.Tensor", list["torch.Tensor"]]:
+    import torch
+
+    # torch.stack checks the shapes in C, which is faster than probing them up front
+    try:
+        return torch.stack(value)
     except RuntimeError:
-        return tensors
+        return value
 
 
-def _convert_to_tensor(value: Any) -> Union["torch.Tensor", list, str]:
+def _copy_ndarrays_into_batch(arrays: list["np.ndarray"]) -> "np.ndarray":
     """
-    Converts various data types (e.g., lists, numbers, ndarrays) into PyTorch tensors.
+    Copies arrays of one shape into a single batch array, promoting their dtypes as
+    `np.array` does. Small batches are built by a single `np.array` call. Large
+    batches are split into contiguous chunks of rows that are stacked into a
+    preallocated batch on a thread pool, numpy releases the GIL while copying.
 
     Args:
-        value (Any): The input value to convert. Can be a list, number, ndarray, or tensor.
+        arrays (list[np.ndarray]): The arrays to copy.
 
     Returns:
-        torch.Tensor | list | str: The converted PyTorch tensor, or the original value if conversion is not possible.
+        np.ndarray: The batch array of shape (len(arrays), *arrays[0].shape).
 
     Raises:
-        TypeError: If the input is an empty list.
+        ValueError: If the arrays do not all have the same shape.
     """
     import numpy as np
-    import torch
-    from PIL.Image import Image as PILImage
 
+    first = arrays[0]
+    num_workers = min(_MAX_COPY_WORKERS, len(arrays), os.cpu_count() or 1)
+    if len(arrays) * first.nbytes < _PARALLEL_COPY_MIN_BYTES or num_workers == 1:
+        return np.array(arrays)
+
+    # the batch is allocated in native byte order so torch can share it
+    dtype = np.result_type(*arrays).newbyteorder("=")
+    out = np.empty((len(arrays), *first.shape), dtype=dtype)
+
+    def copy_rows(start: int, stop: int) -> None:
+        np.stack(arrays[start:stop], out=out[start:stop])
+
+    bounds = [len(arrays) * i // num_workers for i in range(num_workers + 1)]
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        list(executor.map(copy_rows, bounds[:-1], bounds[1:]))
+    return out
+
+
+def _ndarray_list_to_tensor(
+    value: list["np.ndarray"],
+) -> Union["torch.Tensor", list["torch.Tensor"]]:
+    # numpy checks the shapes and promotes mixed dtypes while batching, ragged arrays
+    # cannot be stacked and are converted one by one
     try:
-        if isinstance(value, list):
-            if len(value) == 0:
-                return torch.tensor(value)
-            if isinstance(value[0], list):
-                value = [_convert_to_tensor(item) for item in value]
-            if isinstance(value[0], numbers.Number):
-                return torch.tensor(value)
-            elif isinstance(value[0], torch.Tensor):
-                return _stack_tensors_if_possible(value)
-            elif isinstance(value[0], np.ndarray):
-                return torch.from_numpy(np.array(value))
-            elif isinstance(value[0], str):
-                return value
-        elif isinstance(value, PILImage):
-            from torchvision.transforms.functional import to_tensor
-
-            return to_tensor(value)
-        elif isinstance(value, numbers.Number):
-            return torch.tensor(value)
-        elif isinstance(value, np.ndarray):
-            return torch.from_numpy(value)
+        batch = _copy_ndarrays_into_batch(value)
+    except ValueError:
+        return [_ndarray_to_tensor(item) for item in value]
+    return _ndarray_to_tensor(batch)
+
+
+# converters for single values and for lists, keyed by the kind of the value or of
+# the first list element; kinds without an entry are returned unchanged
+_LEAF_CONVERTERS: dict[int, Callable[[Any], Any]] = {
+    _KIND_NUMBER: _number_to_tensor,
+    _KIND_NDARRAY: _ndarray_to_tensor,
+    _KIND_PIL_IMAGE: _pil_image_to_tensor,
+}
+_LIST_CONVERTERS: dict[int, Callable[[list], Any]] = {
+    _KIND_NUMBER: _number_to_tensor,
+    _KIND_TENSOR: _tensor_list_to_tensor,
+    _KIND_NDARRAY: _ndarray_list_to_tensor,
+}
+
+
+def _convert_leaf_to_tensor(value: Any) -> Union["torch.Tensor", Any]:
+    """
+    Converts a single non-list value (number, ndarray or PIL image) into a tensor.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        torch.Tensor | Any: The converted tensor, or the original value if conversion is not possible.
+    """
+    convert = _LEAF_CONVERTERS.get(_value_kind(value))
+    if convert is None:
         return value
+    try:
+        return convert(value)
     except Exception as e:
-        logger.warning(
-            f"Failed to convert value {value} of type {type(value)} to tensor: {e}"
-        )
+        _warn_conversion_failed(value, e)
+        return value
+
+
+def _convert_list_to_tensor(value: list) -> Union["torch.Tensor", list]:
+    """
+    Converts a list whose nested lists have already been converted into a tensor.
+    The conversion is chosen by the kind of the first element.
+
+    Args:
+        value (list): The list to convert.
+
+    Returns:
+        torch.Tensor | list: The converted tensor, or the list itself if conversion is not possible.
+    """
+    if not value:
+        return _number_to_tensor(value)
+    convert = _LIST_CONVERTERS.get(_value_kind(value[0]))
+    if convert is None:
+        return value
+    try:
+        return convert(value)
+    except Exception as e:
+        _warn_conversion_failed(value, e)
         return value
 
 
+def _convert_to_tensor(value: Any) -> Union["torch.Tensor", list, str]:
+    """
+    Converts various data types (e.g., lists, numbers, ndarrays) into PyTorch tensors.
+    Nested lists are converted bottom-up with an explicit work stack instead of
+    recursion, each level is stacked into a tensor if possible or kept as a list.
+
+    Args:
+        value (Any): The input value to convert. Can be a list, number, ndarray, or tensor.
+
+    Returns:
+        torch.Tensor | list | str: The converted PyTorch tensor, or the original value if conversion is not possible.
+    """
+    import torch
+
+    # lists of strings or bytes are never converted
+    if type(value) is list and value and type(value[0]) in (str, bytes):
+        return value
+
+    # empty lists and lists of empty lists, as produced for missing fields
+    if type(value) is list and all(type(item) is list and not item for item in value):
+        return torch.empty(len(value), 0) if value else torch.empty(0)
+
+    if _value_kind(value) != _KIND_LIST:
+        return _convert_leaf_to_tensor(value)
+
+    # post-order walk, a list is converted once all of its nested lists are
+    converted: dict[int, Any] = {}
+    stack: list[tuple[list, bool]] = [(value, False)]
+    while stack:
+        node, children_converted = stack.pop()
+        if id(node) in converted:
+            continue
+        is_nested = len(node) > 0 and _value_kind(node[0]) == _KIND_LIST
+        if is_nested and not children_converted:
+            rows = _number_rows_to_tensor(node)
+            if rows is not None:
+                converted[id(node)] = rows
+                continue
+            stack.append((node, True))
+            stack.extend(
+                (item, False) for item in node if _value_kind(item) == _KIND_LIST
+            )
+            continue
+        if is_nested:
+            node_items = [
+                converted[id(item)]
+                if _value_kind(item) == _KIND_LIST
+                else _convert_leaf_to_tensor(item)
+                for item in node
+            ]
+        else:
+            node_items = node
+        converted[id(node)] = _convert_list_to_tensor(node_items)
+    return converted[id(value)]
+
+
 def _convert_from_tensor(value: Any):
     import torch
 
@@ -0,0 +1,31 @@
+import pytest
+
+from tests.utilities.mock_payloads import MockPayloads
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """
+    Skip the benchmark tests unless they are selected with `-m benchmark` or
+    `--benchmark-only`, as done by scripts/bench.sh, and pytest-benchmark is installed.
+    """
+    if not config.pluginmanager.has_plugin("benchmark"):
+        skip = pytest.mark.skip(reason="requires pytest-benchmark")
+    elif "benchmark" in (config.getoption("markexpr") or "") or config.getoption(
+        "benchmark_only"
+    ):
+        return
+    else:
+        skip = pytest.mark.skip(reason="benchmarks run with `-m benchmark`")
+    for item in items:
+        if item.get_closest_marker("benchmark") is not None:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def mock_payloads() -> MockPayloads:
+    """
+    Fixture to provide the lazily built payloads for mocked downloads.
+    """
+    return MockPayloads()
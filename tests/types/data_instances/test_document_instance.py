@@ -12,68 +12,54 @@ class TestDocumentInstance(DataModelTestBase):
     """
 
     factory = DocumentInstanceFactory
+    tensor_fields = ("index", "page_id", "total_num_pages")
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "index": pa.int64(),
-            "sample_id": pa.string(),
-            "page_id": pa.int64(),
-            "total_num_pages": pa.int64(),
-            "image": {
-                "file_path": pa.string(),
-                "content": pa.binary(),
-                "source_width": pa.int64(),
-                "source_height": pa.int64(),
-            },
-            "gt": {
-                "classification": pa.string(),
-                "ser": pa.string(),
-                "ocr": pa.string(),
-                "qa": pa.string(),
-                "vqa": pa.string(),
-                "layout": pa.string(),
-            },
-            "ocr": {
-                "file_path": pa.string(),
-                "content": pa.binary(),
-                "type": pa.string(),
-            },
-        }
-
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
-        """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "index": pa.int64(),
-            "sample_id": pa.string(),
-            "page_id": pa.int64(),
-            "total_num_pages": pa.int64(),
-            "image_file_path": pa.string(),
-            "image_content": pa.binary(),
-            "image_source_width": pa.int64(),
-            "image_source_height": pa.int64(),
-            "gt_classification": pa.string(),
-            "gt_ser": pa.string(),
-            "gt_ocr": pa.string(),
-            "gt_qa": pa.string(),
-            "gt_vqa": pa.string(),
-            "gt_layout": pa.string(),
-            "ocr_file_path": pa.string(),
-            "ocr_content": pa.binary(),
-            "ocr_type": pa.string(),
-        }
+    expected_table_schema = {
+        "index": pa.int64(),
+        "sample_id": pa.string(),
+        "page_id": pa.int64(),
+        "total_num_pages": pa.int64(),
+        "image": {
+            "file_path": pa.string(),
+            "content": pa.binary(),
+            "source_width": pa.int64(),
+            "source_height": pa.int64(),
+        },
+        "gt": {
+            "classification": pa.string(),
+            "ser": pa.string(),
+            "ocr": pa.string(),
+            "qa": pa.string(),
+            "vqa": pa.string(),
+            "layout": pa.string(),
+        },
+        "ocr": {"file_path": pa.string(), "content": pa.binary(), "type": pa.string()},
+    }
+    expected_table_schema_flattened = {
+        "index": pa.int64(),
+        "sample_id": pa.string(),
+        "page_id": pa.int64(),
+        "total_num_pages": pa.int64(),
+        "image_file_path": pa.string(),
+        "image_content": pa.binary(),
+        "image_source_width": pa.int64(),
+        "image_source_height": pa.int64(),
+        "gt_classification": pa.string(),
+        "gt_ser": pa.string(),
+        "gt_ocr": pa.string(),
+        "gt_qa": pa.string(),
+        "gt_vqa": pa.string(),
+        "gt_layout": pa.string(),
+        "ocr_file_path": pa.string(),
+        "ocr_content": pa.binary(),
+        "ocr_type": pa.string(),
+    }
 
-    def test_to_from_tensor(self, model_instance: DocumentInstance) -> None:
+    def test_to_from_tensor(self, loaded_model_instance: DocumentInstance) -> None:
         """
         Test the conversion of the model instance to a tensor.
         """
-        model_instance.load()
+        model_instance = loaded_model_instance.shallow_clone()
         tensor_model = model_instance.to_tensor()
         assert tensor_model is not None, "Tensor conversion returned None"
         roundtrip_model = tensor_model.to_raw()
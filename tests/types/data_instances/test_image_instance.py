@@ -12,56 +12,46 @@ class TestImageInstance(DataModelTestBase):
     """
 
     factory = ImageInstanceFactory
+    tensor_fields = ("index",)
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "index": pa.int64(),
-            "sample_id": pa.string(),
-            "image": {
-                "file_path": pa.string(),
-                "content": pa.binary(),
-                "source_width": pa.int64(),
-                "source_height": pa.int64(),
-            },
-            "gt": {
-                "classification": pa.string(),
-                "ser": pa.string(),
-                "ocr": pa.string(),
-                "qa": pa.string(),
-                "vqa": pa.string(),
-                "layout": pa.string(),
-            },
-        }
-
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
-        """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "index": pa.int64(),
-            "sample_id": pa.string(),
-            "image_file_path": pa.string(),
-            "image_content": pa.binary(),
-            "image_source_width": pa.int64(),
-            "image_source_height": pa.int64(),
-            "gt_classification": pa.string(),
-            "gt_ser": pa.string(),
-            "gt_ocr": pa.string(),
-            "gt_qa": pa.string(),
-            "gt_vqa": pa.string(),
-            "gt_layout": pa.string(),
-        }
+    expected_table_schema = {
+        "index": pa.int64(),
+        "sample_id": pa.string(),
+        "image": {
+            "file_path": pa.string(),
+            "content": pa.binary(),
+            "source_width": pa.int64(),
+            "source_height": pa.int64(),
+        },
+        "gt": {
+            "classification": pa.string(),
+            "ser": pa.string(),
+            "ocr": pa.string(),
+            "qa": pa.string(),
+            "vqa": pa.string(),
+            "layout": pa.string(),
+        },
+    }
+    expected_table_schema_flattened = {
+        "index": pa.int64(),
+        "sample_id": pa.string(),
+        "image_file_path": pa.string(),
+        "image_content": pa.binary(),
+        "image_source_width": pa.int64(),
+        "image_source_height": pa.int64(),
+        "gt_classification": pa.string(),
+        "gt_ser": pa.string(),
+        "gt_ocr": pa.string(),
+        "gt_qa": pa.string(),
+        "gt_vqa": pa.string(),
+        "gt_layout": pa.string(),
+    }
 
-    def test_to_from_tensor(self, model_instance: ImageInstance) -> None:
+    def test_to_from_tensor(self, loaded_model_instance: ImageInstance) -> None:
         """
         Test the conversion of the model instance to a tensor.
         """
-        model_instance.load()
+        model_instance = loaded_model_instance.shallow_clone()
         tensor_model = model_instance.to_tensor()
         assert tensor_model is not None, "Tensor conversion returned None"
         roundtrip_model = tensor_model.to_raw()
@@ -1,33 +1,56 @@
+import copy
+import os
+
 import factory
 import pyarrow as pa
 import pytest
 
 from atria_core.logger.logger import get_logger
 from atria_core.types.base.data_model import BaseDataModel
-from tests.utilities.common import _assert_values_equal, _validate_batched_values
+from tests.utilities.common import (
+    _assert_batched_equals_unbatched,
+    _assert_values_equal,
+)
 
 logger = get_logger(__name__)
 
+# number of random factory samples each test is run against, set with ATRIA_TEST_SAMPLES
+NUM_TEST_SAMPLES = int(os.environ.get("ATRIA_TEST_SAMPLES", "1"))
+
 
 class DataModelTestBase:
     factory: type[factory.Factory]
+    # fields of the model that hold tensors after `to_tensor`
+    tensor_fields: tuple[str, ...]
+    # expected `table_schema` and `table_schema_flattened` of the model
+    expected_table_schema: dict[str, pa.DataType]
+    expected_table_schema_flattened: dict[str, pa.DataType]
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        raise NotImplementedError(
-            "Child classes must implement the `expected_table_schema` method."
-        )
+    @pytest.fixture(scope="class", params=list(range(NUM_TEST_SAMPLES)))
+    @classmethod
+    def model_instance(cls) -> BaseDataModel:
+        """
+        Fixture to provide an instance of the BaseDataModel for testing. The instance
+        is built once per test class, tests that modify it work on a clone.
+        """
+        return cls.factory.build()
 
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
-        raise NotImplementedError(
-            "Child classes must implement the `expected_table_schema_flattened` method."
-        )
+    @pytest.fixture(scope="class")
+    @classmethod
+    def loaded_model_instance(cls, model_instance: BaseDataModel) -> BaseDataModel:
+        """
+        Fixture to provide a loaded instance of the BaseDataModel. Loading is done
+        once per test class; tests that convert the instance work on a clone.
+        """
+        return model_instance.shallow_clone().load()
 
-    @pytest.fixture(params=list(range(1)))
-    def model_instance(self) -> BaseDataModel:
+    @pytest.fixture
+    def tensor_instance(self, loaded_model_instance: BaseDataModel) -> BaseDataModel:
         """
-        Fixture to provide an instance of the BaseDataModel for testing.
+        Fixture to provide a tensor clone of the loaded instance. Tensor conversion
+        and device moves happen in place, so every test gets its own clone.
         """
-        return self.factory.build()
+        return loaded_model_instance.shallow_clone().to_tensor()
 
     def test_initialize(self, model_instance: BaseDataModel) -> None:
         """
@@ -41,12 +64,25 @@ class DataModelTestBase:
         """
         Test the load method of the model instance.
         """
+        model_instance = model_instance.shallow_clone()
         assert not model_instance._is_loaded, "Model instance should be unloaded"
         model_instance.load()
         assert model_instance._is_loaded, "Model instance should be loaded"
         model_instance.unload()
         assert not model_instance._is_loaded, "Model instance should be unloaded again"
 
+    def test_shallow_clone(self, loaded_model_instance: BaseDataModel) -> None:
+        """
+        Test that converting a clone does not modify the original instance.
+        """
+        clone = loaded_model_instance.shallow_clone()
+        assert clone is not loaded_model_instance
+        for key, value in loaded_model_instance.__dict__.items():
+            if isinstance(value, BaseDataModel):
+                assert getattr(clone, key) is not value, f"Field {key} is shared"
+        clone.to_tensor().unload()
+        assert loaded_model_instance._is_loaded, "Original instance was unloaded"
+
     def test_to_from_row(self, model_instance: BaseDataModel) -> None:
         """
         Test the conversion to and from a row representation.
@@ -57,18 +93,69 @@ class DataModelTestBase:
         assert isinstance(new_instance, BaseDataModel), (
             "New instance should be a BaseDataModel"
         )
-        assert new_instance.model_dump() == model_instance.model_dump(), (
-            "New instance does not match original"
+        # compare the models directly and only serialize both sides when that fails,
+        # e.g. PIL images decoded from the row are a different class than the original
+        if new_instance != model_instance:
+            assert new_instance.model_dump() == model_instance.model_dump(), (
+                "New instance does not match original"
+            )
+
+    def test_deepcopy(self, tensor_instance: BaseDataModel) -> None:
+        """
+        Test that a deep copy of the tensor instance holds its own tensors.
+        """
+        instance = tensor_instance
+        copied = copy.deepcopy(instance)
+        for key in self.tensor_fields:
+            value = getattr(copied, key)
+            assert value.data_ptr() != getattr(instance, key).data_ptr(), (
+                f"Field {key} shares its storage with the original"
+            )
+        _assert_values_equal(copied, instance)
+
+    def test_deepcopy_batched_repeat(self, tensor_instance: BaseDataModel) -> None:
+        """
+        Test that a deep copy of a repeated batch keeps its tensors as expanded views.
+        """
+        batch = tensor_instance.batched_repeat(8)
+        copied = copy.deepcopy(batch)
+        for key in self.tensor_fields:
+            value, original = getattr(copied, key), getattr(batch, key)
+            assert value.stride() == original.stride()
+            assert (
+                value.untyped_storage().nbytes() == original.untyped_storage().nbytes()
+            ), f"Field {key} was materialized by the deep copy"
+        _assert_values_equal(copied, batch)
+
+    def test_clone_via_arrow(
+        self, model_instance: BaseDataModel, tensor_instance: BaseDataModel
+    ) -> None:
+        """
+        Test cloning the model instance through a pyarrow table.
+        """
+        clone = model_instance.clone_via_arrow()
+        assert clone is not model_instance
+        assert clone.to_row() == model_instance.to_row(), (
+            "Clone does not match original"
         )
 
+        # cloning must leave the source, including its tensors, unchanged
+        snapshot = tensor_instance.shallow_clone()
+        tensor_instance.clone_via_arrow()
+        _assert_values_equal(tensor_instance, snapshot)
+        for key in self.tensor_fields:
+            assert getattr(tensor_instance, key) is getattr(snapshot, key), (
+                f"Field {key} was changed by clone_via_arrow"
+            )
+
     def test_schema(self, model_instance: BaseDataModel) -> None:
         """
         Test the schema generation of the model instance.
         """
         schema = model_instance.table_schema()
-        assert schema == self.expected_table_schema(), (
+        assert schema == self.expected_table_schema, (
             "Schema does not match expected schema"
-            f"Expected: {self.expected_table_schema()}, Got: {schema}"
+            f"Expected: {self.expected_table_schema}, Got: {schema}"
         )
 
     def test_schema_flattened(self, model_instance: BaseDataModel) -> None:
@@ -76,16 +163,16 @@ class DataModelTestBase:
         Test the schema generation of the model instance.
         """
         schema = model_instance.table_schema_flattened()
-        assert schema == self.expected_table_schema_flattened(), (
+        assert schema == self.expected_table_schema_flattened, (
             "Flattened schema does not match expected schema"
-            f"Expected: {self.expected_table_schema_flattened()}, Got: {schema}"
+            f"Expected: {self.expected_table_schema_flattened}, Got: {schema}"
         )
 
-    def test_to_from_tensor(self, model_instance: BaseDataModel) -> None:
+    def test_to_from_tensor(self, loaded_model_instance: BaseDataModel) -> None:
         """
         Test the conversion of the model instance to a tensor.
         """
-        model_instance.load()
+        model_instance = loaded_model_instance.shallow_clone()
         tensor_model = model_instance.to_tensor()
         assert tensor_model is not None, "Tensor conversion returned None"
         roundtrip_model = tensor_model.to_raw()
@@ -93,21 +180,32 @@ class DataModelTestBase:
             "Raw conversion did not return a BaseDataModel"
         )
 
-        _assert_values_equal(roundtrip_model, model_instance)
+        _assert_values_equal(roundtrip_model, loaded_model_instance)
 
-    def test_to_device(self, model_instance):
+    def test_to_device(
+        self, loaded_model_instance: BaseDataModel, request: pytest.FixtureRequest
+    ) -> None:
         """
         Test the to_device method of the tensor data model.
         """
         import torch
 
-        def validate_device(device: str | torch.device):
-            instance = model_instance.load().to_tensor().to_device(device)
-            for key, value in instance.__dict__.items():
-                if isinstance(value, torch.Tensor):
-                    assert value.device.type == torch.device(device).type, (
-                        f"Field {key} is not on the correct device: {value.device.type} != {torch.device(device).type}"
-                    )
+        # nothing to check on the device for models without top-level tensor fields
+        if not self.tensor_fields:
+            return
+
+        # requested lazily so models without tensor fields never build the instance;
+        # to_device moves the tensors in place, so one tensor instance serves all devices
+        tensor_instance = request.getfixturevalue("tensor_instance")
+
+        def validate_device(device: str | int | torch.device):
+            instance = tensor_instance.to_device(device)
+            expected_type = torch.device(device).type
+            for key in self.tensor_fields:
+                value = getattr(instance, key)
+                assert value.device.type == expected_type, (
+                    f"Field {key} is not on the correct device: {value.device.type} != {expected_type}"
+                )
 
         validate_device(torch.device("cpu"))
         if not torch.cuda.is_available():
@@ -117,24 +215,36 @@ class DataModelTestBase:
         validate_device(torch.device("cuda:0"))
         validate_device(0)
 
-    def test_batched_instances(self, model_instance):
+    def test_batched_instances(self, loaded_model_instance, tensor_instance):
         """
         Test the collation of multiple instances of the child class.
         """
         import torch
 
-        instances = [
-            model_instance.load().to_tensor(),
-            model_instance.load().to_tensor(),
-        ]
+        # batching is not limited to tensors, check the raw path first
+        raw_batched = loaded_model_instance.batched([loaded_model_instance] * 2)
+        assert raw_batched._is_batched and raw_batched.batch_size == 2
+
+        instances = [tensor_instance, tensor_instance.shallow_clone()]
         model_instance = instances[0].batched(instances)
         assert model_instance._is_batched, (
             "Batched instances should be marked as batched"
         )
 
-        for key, value in model_instance.__dict__.items():
-            if isinstance(value, torch.Tensor):
-                assert value.shape[0] == len(instances)
-                for i in range(1, len(instances)):
-                    _assert_values_equal(value[i], getattr(instances[i], key))
-        _validate_batched_values(model_instance, instances)
+        for key in self.tensor_fields:
+            value = getattr(model_instance, key)
+            assert isinstance(value, torch.Tensor), f"Field {key} is not a tensor"
+            assert value.shape[0] == len(instances)
+            for i in range(1, len(instances)):
+                _assert_values_equal(value[i], getattr(instances[i], key))
+        _assert_batched_equals_unbatched(model_instance, instances)
+
+    def test_batched_repeat(self, tensor_instance):
+        """
+        Test that repeating an instance matches batching copies of it.
+        """
+        instance = tensor_instance
+        repeated = instance.batched_repeat(3)
+        assert repeated._is_batched, "Repeated instance should be marked as batched"
+        assert repeated.batch_size == 3
+        _assert_values_equal(repeated, instance.batched([instance] * 3))
@@ -1,38 +1,77 @@
 import pyarrow as pa
+import pytest
 
-from atria_core.types.factory import AnnotatedObjectFactory
+from atria_core.types.factory import AnnotatedObjectFactory, AnnotatedObjectListFactory
+from atria_core.types.generic.annotated_object import (
+    AnnotatedObject,
+    AnnotatedObjectList,
+)
 from tests.types.data_model_test_base import DataModelTestBase
 
 
+@pytest.fixture(scope="session")
+def ten_annotated_objects() -> list[AnnotatedObject]:
+    """
+    Builds the annotated objects backing the list tests once per session.
+    """
+    return AnnotatedObjectFactory.build_batch(10)
+
+
 class TestAnnotatedObject(DataModelTestBase):
     """
     Test class for AnnotatedObject.
     """
 
     factory = AnnotatedObjectFactory
+    tensor_fields = ("segmentation", "iscrowd")
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "label": {"value": pa.int64(), "name": pa.string()},
-            "bbox": {"value": pa.list_(pa.float64()), "mode": pa.string()},
-            "segmentation": pa.list_(pa.list_(pa.float64())),
-            "iscrowd": pa.bool_(),
-        }
-
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
+    expected_table_schema = {
+        "label": {"value": pa.int64(), "name": pa.string()},
+        "bbox": {"value": pa.list_(pa.float64()), "mode": pa.string()},
+        "segmentation": pa.list_(pa.list_(pa.float64())),
+        "iscrowd": pa.bool_(),
+    }
+    expected_table_schema_flattened = {
+        "label_value": pa.int64(),
+        "label_name": pa.string(),
+        "bbox_value": pa.list_(pa.float64()),
+        "bbox_mode": pa.string(),
+        "segmentation": pa.list_(pa.list_(pa.float64())),
+        "iscrowd": pa.bool_(),
+    }
+
+
+class TestAnnotatedObjectList(DataModelTestBase):
+    """
+    Test class for AnnotatedObjectList.
+    """
+
+    factory = AnnotatedObjectListFactory
+    tensor_fields = ("segmentation", "iscrowd")
+
+    expected_table_schema = {
+        "label": {"value": pa.list_(pa.int64()), "name": pa.list_(pa.string())},
+        "bbox": {"value": pa.list_(pa.list_(pa.float64())), "mode": pa.string()},
+        "segmentation": pa.list_(pa.list_(pa.list_(pa.float64()))),
+        "iscrowd": pa.list_(pa.bool_()),
+    }
+    expected_table_schema_flattened = {
+        "label_value": pa.list_(pa.int64()),
+        "label_name": pa.list_(pa.string()),
+        "bbox_value": pa.list_(pa.list_(pa.float64())),
+        "bbox_mode": pa.string(),
+        "segmentation": pa.list_(pa.list_(pa.list_(pa.float64()))),
+        "iscrowd": pa.list_(pa.bool_()),
+    }
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def model_instance(
+        cls, ten_annotated_objects: list[AnnotatedObject]
+    ) -> AnnotatedObjectList:
         """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
+        Fixture to provide an AnnotatedObjectList built from the session-wide
+        annotated objects. `from_list` copies the values into new lists, so the
+        shared objects are never modified by the tests.
         """
-        return {
-            "label_value": pa.int64(),
-            "label_name": pa.string(),
-            "bbox_value": pa.list_(pa.float64()),
-            "bbox_mode": pa.string(),
-            "segmentation": pa.list_(pa.list_(pa.float64())),
-            "iscrowd": pa.bool_(),
-        }
+        return AnnotatedObjectList.from_list(ten_annotated_objects)
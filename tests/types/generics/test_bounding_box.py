@@ -13,20 +13,13 @@ class TestBoundingBox(DataModelTestBase):
     """
 
     factory = BoundingBoxFactory
+    tensor_fields = ("value",)
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {"value": pa.list_(pa.float64()), "mode": pa.string()}
-
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
-        """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {"value": pa.list_(pa.float64()), "mode": pa.string()}
+    expected_table_schema = {"value": pa.list_(pa.float64()), "mode": pa.string()}
+    expected_table_schema_flattened = {
+        "value": pa.list_(pa.float64()),
+        "mode": pa.string(),
+    }
 
 
 #########################################################
@@ -10,31 +10,21 @@ class TestGroundTruth(DataModelTestBase):
     """
 
     factory = GroundTruthFactory
+    tensor_fields = ()
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "classification": pa.string(),
-            "ser": pa.string(),
-            "ocr": pa.string(),
-            "qa": pa.string(),
-            "vqa": pa.string(),
-            "layout": pa.string(),
-        }
-
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
-        """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "classification": pa.string(),
-            "ser": pa.string(),
-            "ocr": pa.string(),
-            "qa": pa.string(),
-            "vqa": pa.string(),
-            "layout": pa.string(),
-        }
+    expected_table_schema = {
+        "classification": pa.string(),
+        "ser": pa.string(),
+        "ocr": pa.string(),
+        "qa": pa.string(),
+        "vqa": pa.string(),
+        "layout": pa.string(),
+    }
+    expected_table_schema_flattened = {
+        "classification": pa.string(),
+        "ser": pa.string(),
+        "ocr": pa.string(),
+        "qa": pa.string(),
+        "vqa": pa.string(),
+        "layout": pa.string(),
+    }
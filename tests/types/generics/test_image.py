@@ -1,17 +1,17 @@
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pyarrow as pa
 import pytest
 import torch  # noqa
 from PIL import Image as PILImageModule
+from PIL.ImageFile import ImageFile
 
 from atria_core.types.base.data_model import BaseDataModel
 from atria_core.types.factory import ImageFactory
 from atria_core.types.generic.image import Image
-from atria_core.utilities.encoding import _image_to_bytes
 from tests.types.data_model_test_base import DataModelTestBase
 from tests.utilities.common import _assert_values_equal
+from tests.utilities.mock_payloads import MockPayloads
 
 
 class TestImage(DataModelTestBase):
@@ -20,36 +20,26 @@ class TestImage(DataModelTestBase):
     """
 
     factory = ImageFactory
-
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "file_path": pa.string(),
-            "content": pa.binary(),
-            "source_width": pa.int64(),
-            "source_height": pa.int64(),
-        }
-
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
-        """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "file_path": pa.string(),
-            "content": pa.binary(),
-            "source_width": pa.int64(),
-            "source_height": pa.int64(),
-        }
-
-    def test_to_from_tensor(self, model_instance: BaseDataModel) -> None:
+    tensor_fields = ("content",)
+
+    expected_table_schema = {
+        "file_path": pa.string(),
+        "content": pa.binary(),
+        "source_width": pa.int64(),
+        "source_height": pa.int64(),
+    }
+    expected_table_schema_flattened = {
+        "file_path": pa.string(),
+        "content": pa.binary(),
+        "source_width": pa.int64(),
+        "source_height": pa.int64(),
+    }
+
+    def test_to_from_tensor(self, loaded_model_instance: BaseDataModel) -> None:
         """
         Test the conversion of the model instance to a tensor.
         """
-        model_instance.load()
+        model_instance = loaded_model_instance.shallow_clone()
         tensor_model = model_instance.to_tensor()
         assert tensor_model is not None, "Tensor conversion returned None"
         roundtrip_model = tensor_model.to_raw()
@@ -66,9 +56,9 @@ class TestImage(DataModelTestBase):
 #########################################################
 # Basic Image Tests
 #########################################################
-@pytest.fixture
-def valid_image_path(tmp_path: Path) -> str:
-    image_path = tmp_path / "test_image.jpg"
+@pytest.fixture(scope="session")
+def valid_image_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    image_path = tmp_path_factory.mktemp("img") / "test_image.jpg"
     PILImageModule.new("RGB", (100, 100)).save(image_path)
     return str(image_path)
 
@@ -78,6 +68,19 @@ def valid_raw_image(valid_image_path: str) -> Image:
     return Image(file_path=valid_image_path)
 
 
+@pytest.fixture(scope="session")
+def session_loaded_raw_image(valid_image_path: str) -> Image:
+    return Image(file_path=valid_image_path).load()
+
+
+@pytest.fixture
+def loaded_raw_image(session_loaded_raw_image: Image) -> Image:
+    # copy the decoded pixels so tests can modify the content without decoding again
+    raw_image = session_loaded_raw_image.model_copy()
+    raw_image.content = session_loaded_raw_image.content.copy()
+    return raw_image
+
+
 def test_image_initialization(valid_image_path: str) -> None:
     raw_image = Image(file_path=valid_image_path)
     assert str(raw_image.file_path) == valid_image_path
@@ -91,10 +94,10 @@ def test_load_from_file(valid_raw_image: Image) -> None:
 
 
 @patch("requests.get")
-def test_load_from_url(mock_get: MagicMock) -> None:
+def test_load_from_url(mock_get: MagicMock, mock_payloads: MockPayloads) -> None:
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.content = _image_to_bytes(PILImageModule.new("RGB", (100, 100)))
+    mock_response.content = mock_payloads.image("RGB", (100, 100))
     mock_get.return_value = mock_response
 
     raw_image = Image(file_path="https://example.com/test_image.jpg")
@@ -102,44 +105,47 @@ def test_load_from_url(mock_get: MagicMock) -> None:
     assert raw_image.content is not None
 
 
-def test_unload(valid_raw_image: Image) -> None:
-    valid_raw_image.load()
-    valid_raw_image.unload()
-    assert valid_raw_image.content is None
+def test_unload(loaded_raw_image: Image) -> None:
+    loaded_raw_image.unload()
+    assert loaded_raw_image.content is None
 
 
-def test_to_rgb(valid_raw_image: Image) -> None:
-    valid_raw_image.load()
-    valid_raw_image.content = valid_raw_image.content.convert("L")
-    assert valid_raw_image.channels == 1
-    valid_raw_image.to_rgb()
-    assert valid_raw_image.channels == 3
+def test_to_rgb(loaded_raw_image: Image) -> None:
+    loaded_raw_image.content = loaded_raw_image.content.convert("L")
+    assert loaded_raw_image.channels == 1
+    loaded_raw_image.to_rgb()
+    assert loaded_raw_image.channels == 3
 
 
-def test_resize(valid_raw_image: Image) -> None:
-    valid_raw_image.load()
-    valid_raw_image.resize(50, 50)
-    assert valid_raw_image.size == (50, 50)
+def test_resize(loaded_raw_image: Image) -> None:
+    loaded_raw_image.resize(50, 50)
+    assert loaded_raw_image.size == (50, 50)
 
 
-def test_shape(valid_raw_image: Image) -> None:
-    valid_raw_image.load()
-    assert valid_raw_image.shape == (3, 100, 100)
+@pytest.fixture
+def header_only_raw_image(valid_raw_image: Image) -> Image:
+    # PIL only parses the header on load and decodes the pixels on first access,
+    # fail if a test that only reads metadata triggers the decoding
+    with patch.object(
+        ImageFile, "load", side_effect=AssertionError("Image pixels were decoded")
+    ):
+        yield valid_raw_image.load()
 
 
-def test_size(valid_raw_image: Image) -> None:
-    valid_raw_image.load()
-    assert valid_raw_image.size == (100, 100)
+def test_shape(header_only_raw_image: Image) -> None:
+    assert header_only_raw_image.shape == (3, 100, 100)
 
 
-def test_channels(valid_raw_image: Image) -> None:
-    valid_raw_image.load()
-    assert valid_raw_image.channels == 3
+def test_size(header_only_raw_image: Image) -> None:
+    assert header_only_raw_image.size == (100, 100)
 
 
-def test_to_tensor(valid_raw_image: Image) -> None:
-    valid_raw_image.load()
-    tensor = valid_raw_image.to_tensor()
+def test_channels(header_only_raw_image: Image) -> None:
+    assert header_only_raw_image.channels == 3
+
+
+def test_to_tensor(loaded_raw_image: Image) -> None:
+    tensor = loaded_raw_image.to_tensor()
     assert tensor is not None
     assert tensor.shape == (3, 100, 100)
 
@@ -151,18 +157,14 @@ def test_to_tensor_without_content() -> None:
         raw_image.tensor_data_model()
 
 
-def test_to_tensor_grayscale(valid_raw_image: Image) -> None:
-    valid_raw_image.load()
-    valid_raw_image.content = valid_raw_image.content.convert("L")
-    tensor = valid_raw_image.to_tensor()
+def test_to_tensor_grayscale(loaded_raw_image: Image) -> None:
+    loaded_raw_image.content = loaded_raw_image.content.convert("L")
+    tensor = loaded_raw_image.to_tensor()
     assert tensor.shape == (1, 100, 100)
 
 
-def test_to_tensor_rgba(tmp_path: Path) -> None:
-    image_path = tmp_path / "test_rgba.png"
-    PILImageModule.new("RGBA", (100, 100)).save(image_path)
-    raw_image = Image(file_path=str(image_path))
-    raw_image.load()
+def test_to_tensor_rgba(mock_payloads: MockPayloads) -> None:
+    raw_image = Image(content=mock_payloads.image("RGBA", (100, 100)))
     tensor = raw_image.to_tensor()
     assert tensor.shape == (4, 100, 100)
 
@@ -214,15 +216,52 @@ def test_tensor_image_resize(valid_rgb_tensor_image: Image) -> None:
 
 
 def test_batched_images(valid_rgb_tensor_image: Image) -> None:
-    batched_image = valid_rgb_tensor_image.batched(
-        [valid_rgb_tensor_image, valid_rgb_tensor_image, valid_rgb_tensor_image]
-    )
+    batched_image = valid_rgb_tensor_image.batched_repeat(3)
     assert batched_image is not None
     assert batched_image._is_batched is True
     assert len(batched_image.content) == 3
     assert batched_image.content.shape == (3, 3, 32, 32)
 
 
+@pytest.fixture
+def variable_size_model_instances() -> list[Image]:
+    return ImageFactory.build_batch_of_sizes([(32, 32), (48, 32), (32, 64)])
+
+
+def test_batched_variable_sizes(variable_size_model_instances: list[Image]) -> None:
+    batched_image = variable_size_model_instances[0].batched(
+        variable_size_model_instances
+    )
+    assert batched_image._is_batched is True
+    assert isinstance(batched_image.content, list)
+    assert [tuple(content.shape) for content in batched_image.content] == [
+        (3, 32, 32),
+        (3, 32, 48),
+        (3, 64, 32),
+    ]
+    for content, instance in zip(
+        batched_image.content, variable_size_model_instances, strict=True
+    ):
+        _assert_values_equal(content, instance.content)
+
+
+def test_build_batch_of_sizes_owns_content(
+    variable_size_model_instances: list[Image],
+) -> None:
+    storages = {
+        instance.content.untyped_storage().data_ptr()
+        for instance in variable_size_model_instances
+    }
+    assert len(storages) == len(variable_size_model_instances)
+    for instance in variable_size_model_instances:
+        assert instance.content.is_contiguous()
+        assert instance.content.dtype == torch.float32
+        assert (
+            instance.content.untyped_storage().nbytes()
+            == instance.content.numel() * instance.content.element_size()
+        )
+
+
 def test_tensor_image_to_rgb(valid_gray_tensor_image: Image) -> None:
     valid_rgb_tensor_image = valid_gray_tensor_image.to_rgb()
     assert valid_rgb_tensor_image.channels == 3
@@ -231,9 +270,7 @@ def test_tensor_image_to_rgb(valid_gray_tensor_image: Image) -> None:
 
 
 def test_batched_to_rgb(valid_gray_tensor_image: Image) -> None:
-    batch_gray_image = valid_gray_tensor_image.batched(
-        [valid_gray_tensor_image, valid_gray_tensor_image, valid_gray_tensor_image]
-    )
+    batch_gray_image = valid_gray_tensor_image.batched_repeat(3)
     batch_rgb_image = batch_gray_image.to_rgb()
     assert batch_rgb_image.channels == 3
     assert batch_rgb_image.content.shape[1] == 3  # Channels dimension
@@ -1,3 +1,5 @@
+import copy
+
 import pyarrow as pa
 import pytest
 import torch
@@ -14,20 +16,10 @@ class TestLabel(DataModelTestBase):
     """
 
     factory = LabelFactory
+    tensor_fields = ("value",)
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {"name": pa.string(), "value": pa.int64()}
-
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
-        """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {"name": pa.string(), "value": pa.int64()}
+    expected_table_schema = {"name": pa.string(), "value": pa.int64()}
+    expected_table_schema_flattened = {"name": pa.string(), "value": pa.int64()}
 
 
 #########################################################
@@ -131,8 +123,17 @@ def test_tensor_label_batching_functionality() -> None:
     batch_size = 10
 
     # Create batched version with 10 copies of the same label
-    batched_label = label.batched([label] * batch_size).to_device()
+    batched_label = label.batched_repeat(batch_size).to_device()
 
     # Batched result should be 1D tensor with repeated values
     assert batched_label.value.ndim == 1
     assert torch.equal(batched_label.value, torch.tensor([10] * batch_size))
+
+
+def test_tensor_label_deepcopy_sparse_value() -> None:
+    """Test that deep copying a Label holding a sparse tensor uses the default copy."""
+    value = torch.sparse_coo_tensor([[0, 2]], [1, 3], (4,))
+    label = Label.model_construct(value=value, name="SparseLabel")
+    for copied in (copy.deepcopy(label), label.model_copy(deep=True)):
+        assert copied.value is not value
+        assert torch.equal(copied.value.to_dense(), value.to_dense())
@@ -1,6 +1,13 @@
+import copy
+
 import pyarrow as pa
 
+from atria_core.types.base.data_model import BaseDataModel
 from tests.types.data_model_test_base import DataModelTestBase
+from tests.utilities.common import (
+    _assert_batched_equals_unbatched,
+    _assert_values_equal,
+)
 from tests.utilities.mock_data_models import MockDataModelParentFactory
 
 
@@ -10,13 +17,27 @@ class TestMockDataModelParent(DataModelTestBase):
     """
 
     factory = MockDataModelParentFactory
+    tensor_fields = (
+        "required_integer_attribute",
+        "required_integer_list_attribute",
+        "integer_attribute",
+        "float_attribute",
+        "list_attribute",
+        "integer_list_attribute",
+        "float_list_attribute",
+    )
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
+    expected_table_schema = {
+        "required_integer_attribute": pa.int64(),
+        "required_integer_list_attribute": pa.list_(pa.int64()),
+        "integer_attribute": pa.int64(),
+        "float_attribute": pa.float64(),
+        "string_attribute": pa.string(),
+        "list_attribute": pa.list_(pa.int64()),
+        "integer_list_attribute": pa.list_(pa.int64()),
+        "float_list_attribute": pa.list_(pa.float64()),
+        "string_list_attribute": pa.list_(pa.string()),
+        "example_data_model_child": {
             "required_integer_attribute": pa.int64(),
             "required_integer_list_attribute": pa.list_(pa.int64()),
             "integer_attribute": pa.int64(),
@@ -26,43 +47,67 @@ class TestMockDataModelParent(DataModelTestBase):
             "integer_list_attribute": pa.list_(pa.int64()),
             "float_list_attribute": pa.list_(pa.float64()),
             "string_list_attribute": pa.list_(pa.string()),
-            "example_data_model_child": {
-                "required_integer_attribute": pa.int64(),
-                "required_integer_list_attribute": pa.list_(pa.int64()),
-                "integer_attribute": pa.int64(),
-                "float_attribute": pa.float64(),
-                "string_attribute": pa.string(),
-                "list_attribute": pa.list_(pa.int64()),
-                "integer_list_attribute": pa.list_(pa.int64()),
-                "float_list_attribute": pa.list_(pa.float64()),
-                "string_list_attribute": pa.list_(pa.string()),
-            },
-        }
+        },
+    }
+    expected_table_schema_flattened = {
+        "required_integer_attribute": pa.int64(),
+        "required_integer_list_attribute": pa.list_(pa.int64()),
+        "integer_attribute": pa.int64(),
+        "float_attribute": pa.float64(),
+        "string_attribute": pa.string(),
+        "list_attribute": pa.list_(pa.int64()),
+        "integer_list_attribute": pa.list_(pa.int64()),
+        "float_list_attribute": pa.list_(pa.float64()),
+        "string_list_attribute": pa.list_(pa.string()),
+        "example_data_model_child_required_integer_attribute": pa.int64(),
+        "example_data_model_child_required_integer_list_attribute": pa.list_(
+            pa.int64()
+        ),
+        "example_data_model_child_integer_attribute": pa.int64(),
+        "example_data_model_child_float_attribute": pa.float64(),
+        "example_data_model_child_string_attribute": pa.string(),
+        "example_data_model_child_list_attribute": pa.list_(pa.int64()),
+        "example_data_model_child_integer_list_attribute": pa.list_(pa.int64()),
+        "example_data_model_child_float_list_attribute": pa.list_(pa.float64()),
+        "example_data_model_child_string_list_attribute": pa.list_(pa.string()),
+    }
 
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
+    def test_validation(self, model_instance: BaseDataModel) -> None:
         """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
+        Test that the factory output, built without validation, passes validation.
         """
-        return {
-            "required_integer_attribute": pa.int64(),
-            "required_integer_list_attribute": pa.list_(pa.int64()),
-            "integer_attribute": pa.int64(),
-            "float_attribute": pa.float64(),
-            "string_attribute": pa.string(),
-            "list_attribute": pa.list_(pa.int64()),
-            "integer_list_attribute": pa.list_(pa.int64()),
-            "float_list_attribute": pa.list_(pa.float64()),
-            "string_list_attribute": pa.list_(pa.string()),
-            "example_data_model_child_required_integer_attribute": pa.int64(),
-            "example_data_model_child_required_integer_list_attribute": pa.list_(
-                pa.int64()
-            ),
-            "example_data_model_child_integer_attribute": pa.int64(),
-            "example_data_model_child_float_attribute": pa.float64(),
-            "example_data_model_child_string_attribute": pa.string(),
-            "example_data_model_child_list_attribute": pa.list_(pa.int64()),
-            "example_data_model_child_integer_list_attribute": pa.list_(pa.int64()),
-            "example_data_model_child_float_list_attribute": pa.list_(pa.float64()),
-            "example_data_model_child_string_list_attribute": pa.list_(pa.string()),
-        }
+        validated = type(model_instance).model_validate(model_instance.model_dump())
+        _assert_values_equal(validated, model_instance)
+
+    def test_build_batch_vectorized(self) -> None:
+        """
+        Test that the vectorized batch build produces valid, batchable instances.
+        """
+        instances = MockDataModelParentFactory.build_batch_vectorized(4)
+        for instance in instances:
+            validated = type(instance).model_validate(instance.model_dump())
+            _assert_values_equal(validated, instance)
+        instances = [instance.to_tensor() for instance in instances]
+        batched = instances[0].batched(instances)
+        assert batched.batch_size == len(instances)
+        _assert_batched_equals_unbatched(batched, instances)
+
+    def test_deepcopy_storage_shared_with_child(
+        self, tensor_instance: BaseDataModel
+    ) -> None:
+        """
+        Test that storage shared between a field and a nested model's field stays
+        shared in a deep copy.
+        """
+        import torch
+
+        shared = torch.arange(4)
+        child = tensor_instance.example_data_model_child
+        tensor_instance._set_skip_validation("list_attribute", shared)
+        child._set_skip_validation("list_attribute", shared[:])
+        copied = copy.deepcopy(tensor_instance)
+        parent_storage = copied.list_attribute.untyped_storage()
+        child_storage = copied.example_data_model_child.list_attribute.untyped_storage()
+        assert parent_storage.data_ptr() == child_storage.data_ptr()
+        assert parent_storage.data_ptr() != shared.untyped_storage().data_ptr()
+        _assert_values_equal(copied, tensor_instance)
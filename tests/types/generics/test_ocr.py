@@ -2,9 +2,10 @@ from unittest.mock import MagicMock, patch
 
 import pyarrow as pa
 
-from atria_core.types.factory import MOCK_HOCR_TESSERACT, OCRFactory
+from atria_core.types.factory import OCRFactory
 from atria_core.types.generic.ocr import OCR
 from tests.types.data_model_test_base import DataModelTestBase
+from tests.utilities.mock_payloads import MockPayloads
 
 
 class TestOCR(DataModelTestBase):
@@ -13,30 +14,28 @@ class TestOCR(DataModelTestBase):
     """
 
     factory = OCRFactory
+    tensor_fields = ()
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {"file_path": pa.string(), "type": pa.string(), "content": pa.binary()}
-
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
-        """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {"file_path": pa.string(), "type": pa.string(), "content": pa.binary()}
+    expected_table_schema = {
+        "file_path": pa.string(),
+        "type": pa.string(),
+        "content": pa.binary(),
+    }
+    expected_table_schema_flattened = {
+        "file_path": pa.string(),
+        "type": pa.string(),
+        "content": pa.binary(),
+    }
 
 
 #########################################################
 # Basic OCR Tests
 #########################################################
 @patch("requests.get")
-def test_load_from_url(mock_get: MagicMock) -> None:
+def test_load_from_url(mock_get: MagicMock, mock_payloads: MockPayloads) -> None:
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.content = MOCK_HOCR_TESSERACT.encode("utf-8")
+    mock_response.content = mock_payloads.hocr()
     mock_get.return_value = mock_response
 
     raw_image = OCR(file_path="https://example.com/test_image.txt")
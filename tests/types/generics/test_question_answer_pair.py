@@ -10,29 +10,19 @@ class TestQuestionAnswerPair(DataModelTestBase):
     """
 
     factory = QuestionAnswerPairFactory
+    tensor_fields = ("id", "answer_start", "answer_end")
 
-    def expected_table_schema(self) -> dict[str, pa.DataType]:
-        """
-        Expected table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "id": pa.int64(),
-            "question_text": pa.string(),
-            "answer_start": pa.list_(pa.int64()),
-            "answer_end": pa.list_(pa.int64()),
-            "answer_text": pa.list_(pa.string()),
-        }
-
-    def expected_table_schema_flattened(self) -> dict[str, pa.DataType]:
-        """
-        Expected flattened table schema for the BaseDataModel.
-        This should be overridden by child classes to provide specific schemas.
-        """
-        return {
-            "id": pa.int64(),
-            "question_text": pa.string(),
-            "answer_start": pa.list_(pa.int64()),
-            "answer_end": pa.list_(pa.int64()),
-            "answer_text": pa.list_(pa.string()),
-        }
+    expected_table_schema = {
+        "id": pa.int64(),
+        "question_text": pa.string(),
+        "answer_start": pa.list_(pa.int64()),
+        "answer_end": pa.list_(pa.int64()),
+        "answer_text": pa.list_(pa.string()),
+    }
+    expected_table_schema_flattened = {
+        "id": pa.int64(),
+        "question_text": pa.string(),
+        "answer_start": pa.list_(pa.int64()),
+        "answer_end": pa.list_(pa.int64()),
+        "answer_text": pa.list_(pa.string()),
+    }
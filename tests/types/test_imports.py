@@ -1,8 +1,6 @@
+import importlib
+
 IMPORT_CHECK = [
-    # datasets config
-    "AtriaDatasetConfig",
-    "AtriaHuggingfaceDatasetConfig",
-    "AtriaHubDatasetConfig",
     # datasets metadata
     "DatasetShardInfo",
     "SplitInfo",
@@ -30,13 +28,10 @@ IMPORT_CHECK = [
     "VisualQuestionAnswerGT",
     "AnnotatedObject",
     "QuestionAnswerPair",
-    "TokenizedQuestionAnswerPair",
 ]
 
 
 def test_imports():
-    for name in IMPORT_CHECK:
-        try:
-            __import__("atria_core.types", fromlist=[name])
-        except ImportError as e:
-            raise ImportError(f"Failed to import {name}: {e}") from e
+    module = importlib.import_module("atria_core.types")
+    missing = [name for name in IMPORT_CHECK if not hasattr(module, name)]
+    assert not missing, f"Failed to import: {missing}"
@@ -1,3 +1,11 @@
+import math
+from collections import deque
+
+import numpy as np
+import pyarrow as pa
+import torch
+from pydantic import BaseModel
+
 from atria_core.logger import get_logger
 from atria_core.types.base.data_model import BaseDataModel
 
@@ -12,12 +20,6 @@ def _assert_values_equal(value1, value2, float_rtolerance=1e-05):
         - For BaseModel instances, recurses into assert_models_equal.
         - For other types, compares with equality.
     """
-    import math
-
-    import numpy as np
-    import torch
-    from pydantic import BaseModel
-
     # Compare floats with tolerance.
     if isinstance(value1, float) and isinstance(value2, float):
         assert math.isclose(value1, value2, rel_tol=float_rtolerance), (
@@ -43,9 +45,15 @@ def _assert_values_equal(value1, value2, float_rtolerance=1e-05):
         assert value1.dtype == value2.dtype, (
             f"Tensor dtypes differ: {value1.dtype} vs {value2.dtype}"
         )
-        assert torch.allclose(value1, value2, rtol=float_rtolerance), (
-            f"Tensors not close: {value1} vs {value2}"
-        )
+        # exact comparison is enough for integer and bool tensors
+        if not value1.is_floating_point():
+            assert torch.equal(value1, value2), (
+                f"Tensors not equal: {value1} vs {value2}"
+            )
+        else:
+            assert torch.allclose(value1, value2, rtol=float_rtolerance), (
+                f"Tensors not close: {value1} vs {value2}"
+            )
     elif isinstance(value1, np.ndarray) and isinstance(value2, np.ndarray):
         assert value1.shape == value2.shape, (
             f"Tensor shapes differ: {value1.shape} vs {value2.shape}"
@@ -53,9 +61,14 @@ def _assert_values_equal(value1, value2, float_rtolerance=1e-05):
         assert value1.dtype == value2.dtype, (
             f"Tensor dtypes differ: {value1.dtype} vs {value2.dtype}"
         )
-        assert np.allclose(value1, value2, rtol=float_rtolerance), (
-            f"Tensors not close: {value1} vs {value2}"
-        )
+        if not np.issubdtype(value1.dtype, np.floating):
+            assert np.array_equal(value1, value2), (
+                f"Tensors not equal: {value1} vs {value2}"
+            )
+        else:
+            assert np.allclose(value1, value2, rtol=float_rtolerance), (
+                f"Tensors not close: {value1} vs {value2}"
+            )
     # Recurse into nested pydantic models.
     elif isinstance(value1, BaseModel) and isinstance(value2, BaseModel):
         _assert_models_equal(value1, value2, float_rtolerance)
@@ -63,99 +76,97 @@ def _assert_values_equal(value1, value2, float_rtolerance=1e-05):
         assert value1 == value2, f"Values do not match: {value1} vs {value2}"
 
 
-def _assert_attribute_types_equal(model1, model2):
+def _assert_models_equal(model1, model2, float_rtolerance=1e-05):
     """
-    Checks that the common attributes in both models have the same type.
-    Iterates over the model fields as defined by .__fields__.
+    Checks that two pydantic models have:
+        1. Attributes of the same type.
+        2. Close enough values.
+    Both checks are done in a single walk over the fields set on the first model.
     """
-
-    from pydantic import BaseModel
-
-    for field in model1.model_fields_set:
-        # If the field exists in both models.
-        if hasattr(model2, field):
-            type1 = type(getattr(model1, field))
-            type2 = type(getattr(model2, field))
-            if not issubclass(type1, BaseModel):
-                assert type1 == type2, (
-                    f"Type mismatch for field '{field}': {type1} vs {type2}"
-                )
+    values1 = model1.__dict__
+    values2 = model2.__dict__
+    for field in model1.__pydantic_fields_set__:
+        value1 = values1[field]
+        value2 = values2[field]
+        if not isinstance(value1, BaseModel):
+            assert type(value1) is type(value2), (
+                f"Type mismatch for field '{field}': {type(value1)} vs {type(value2)}"
+            )
+        _assert_values_equal(value1, value2, float_rtolerance)
 
 
-def _assert_models_values_equal(model1, model2, float_rtolerance=1e-05):
+def _batched_fields(batched_instances, instances):
     """
-    Checks that two models have the same values.
-    It uses compare_values to handle floats (with tolerance), lists, and nested models.
+    Yields the name, batched value and per-instance values of every batched field,
+    walking nested models with an explicit stack. Skipped and merged fields are left
+    out.
     """
-    # Compare using the dict representations. This assumes that both models return the same keys.
-    for key in model1.model_fields_set:
-        _assert_values_equal(
-            getattr(model1, key), getattr(model2, key), float_rtolerance
+    stack = deque([("", batched_instances, instances)])
+    while stack:
+        prefix, batched, unbatched = stack.pop()
+        excluded = set(batched._batch_skip_fields or ()) | set(
+            batched._batch_merge_fields or ()
         )
+        for attr_name, batched_value in batched.__dict__.items():
+            if attr_name in excluded or batched_value is None:
+                continue
+            values = [instance.__dict__[attr_name] for instance in unbatched]
+            if isinstance(batched_value, BaseDataModel):
+                stack.append((f"{prefix}{attr_name}.", batched_value, values))
+            else:
+                yield f"{prefix}{attr_name}", batched_value, values
 
 
-def _assert_models_equal(model1, model2, float_rtolerance=1e-05):
+def _assert_array_lists_equal(name, batched_value, values):
     """
-    Checks that two pydantic models have:
-        1. Attributes of the same type.
-        2. Close enough values.
+    Checks that two lists of tensors or arrays are equal. Lists of a single shape are
+    stacked and compared in one call, mixed shapes are compared element by element.
     """
-    _assert_attribute_types_equal(model1, model2)
-    _assert_models_values_equal(model1, model2, float_rtolerance)
-
-
-def _validate_batched_values(batched_instances, instances):
-    import torch
+    is_tensor = isinstance(batched_value[0], torch.Tensor)
+    stack, equal = (
+        (torch.stack, torch.equal) if is_tensor else (np.stack, np.array_equal)
+    )
+    shape = batched_value[0].shape
+    if all(item.shape == shape for item in batched_value) and all(
+        value.shape == shape for value in values
+    ):
+        assert equal(stack(batched_value), stack(values)), (
+            f"Field {name} does not match the instance values"
+        )
+        return
+    for i, (item, value) in enumerate(zip(batched_value, values, strict=True)):
+        assert equal(item, value), f"Field {name}[{i}] does not match"
 
-    for attr_name, batched_value in batched_instances.__dict__.items():
-        if (
-            batched_instances._batch_skip_fields
-            and attr_name in batched_instances._batch_skip_fields
-        ):
-            # Skip fields that are meant to be merged in batches.
-            continue
-        if (
-            batched_instances._batch_merge_fields
-            and attr_name in batched_instances._batch_merge_fields
-        ):
-            # Skip fields that are meant to be merged in batches.
-            continue
 
+def _assert_batched_equals_unbatched(batched_instances, instances):
+    """
+    Checks that a batched model holds the values of the instances it was built from.
+    Tensor fields are compared with torch.equal, all other fields are gathered into
+    one pyarrow table per side and compared in a single call.
+    """
+    batched_columns, unbatched_columns = {}, {}
+    for name, batched_value, values in _batched_fields(batched_instances, instances):
         if isinstance(batched_value, torch.Tensor):
+            assert torch.equal(batched_value, torch.stack(values)), (
+                f"Field {name} does not match the stacked instance values"
+            )
             continue
-        if isinstance(batched_value, list) and isinstance(
-            batched_value[0], torch.Tensor
+        assert isinstance(batched_value, list), (
+            f"Field {name} is not a list: {batched_value}"
+        )
+        assert len(batched_value) == len(instances), (
+            f"Field {name} has different lengths: {len(batched_value)} != {len(instances)}"
+        )
+        if len(batched_value) > 0 and isinstance(
+            batched_value[0], torch.Tensor | np.ndarray
         ):
+            _assert_array_lists_equal(name, batched_value, values)
             continue
-        if isinstance(batched_value, BaseDataModel):
-            child_instances = [  # the test checks at most 1 level deep lists of models
-                [getattr(k, attr_name) for k in instance]
-                if isinstance(instance, list)
-                else getattr(instance, attr_name)
-                for instance in instances
-            ]
-            _validate_batched_values(batched_value, child_instances)
-        else:
-            if batched_value is None:
-                continue
-            assert isinstance(batched_value, list), (
-                f"Field {attr_name} is not a list: {batched_value}"
-            )
-            assert len(batched_value) == len(instances), (
-                f"Field {attr_name} has different lengths: {len(batched_value)} != {len(instances)}"
-            )
-            for i in range(len(batched_value)):
-                if isinstance(batched_value[i], list):
-                    for j in range(len(batched_value[i])):
-                        if isinstance(instances[i], list):
-                            _assert_values_equal(
-                                batched_value[i][j], getattr(instances[i][j], attr_name)
-                            )
-                        else:
-                            _assert_values_equal(
-                                batched_value[i][j], getattr(instances[i], attr_name)[j]
-                            )
-                else:
-                    _assert_values_equal(
-                        batched_value[i], getattr(instances[i], attr_name)
-                    )
+        batched_columns[name] = batched_value
+        unbatched_columns[name] = values
+
+    batched_table = pa.table(batched_columns)
+    unbatched_table = pa.table(unbatched_columns)
+    assert batched_table.equals(unbatched_table), (
+        f"Batched values do not match: {batched_table} vs {unbatched_table}"
+    )
@@ -1,4 +1,6 @@
 import factory
+import numpy as np
+from faker.providers.lorem.en_US import Provider as LoremProvider
 from pydantic import Field
 
 from atria_core.logger.logger import get_logger
@@ -14,6 +16,15 @@ from atria_core.types.typing.common import (
 
 logger = get_logger(__name__)
 
+# attributes are drawn from numpy instead of faker providers, words are picked from
+# the same list faker's "word" provider uses
+_RNG = np.random.default_rng(0)
+_WORDS = LoremProvider.word_list
+
+
+def _words(count: int) -> list[str]:
+    return [_WORDS[i] for i in _RNG.integers(0, len(_WORDS), count)]
+
 
 class MockBaseDataModel(BaseDataModel):
     required_integer_attribute: IntField
@@ -39,23 +50,63 @@ class MockBaseDataModelFactory(factory.Factory):
     class Meta:
         model = MockBaseDataModel
 
-    required_integer_attribute = factory.Faker("random_int", min=1, max=100)
-    required_integer_list_attribute = factory.List(
-        [factory.Faker("random_int", min=1, max=100) for _ in range(3)]
+    required_integer_attribute = factory.LazyFunction(
+        lambda: int(_RNG.integers(1, 101))
     )
-    integer_attribute = factory.Faker("random_int", min=0, max=50)
-    float_attribute = factory.Faker("pyfloat", positive=True)
-    string_attribute = factory.Faker("word")
-    list_attribute = factory.List(
-        [factory.Faker("random_int", min=1, max=100) for _ in range(2)]
+    required_integer_list_attribute = factory.LazyFunction(
+        lambda: _RNG.integers(1, 101, 3).tolist()
     )
-    integer_list_attribute = factory.List(
-        [factory.Faker("random_int", min=1, max=100) for _ in range(2)]
+    integer_attribute = factory.LazyFunction(lambda: int(_RNG.integers(0, 51)))
+    float_attribute = factory.LazyFunction(lambda: float(_RNG.random() * 100))
+    string_attribute = factory.LazyFunction(lambda: _words(1)[0])
+    list_attribute = factory.LazyFunction(lambda: _RNG.integers(1, 101, 2).tolist())
+    integer_list_attribute = factory.LazyFunction(
+        lambda: _RNG.integers(1, 101, 2).tolist()
     )
-    float_list_attribute = factory.List(
-        [factory.Faker("pyfloat", positive=True) for _ in range(2)]
-    )
-    string_list_attribute = factory.List([factory.Faker("word") for _ in range(2)])
+    float_list_attribute = factory.LazyFunction(lambda: (_RNG.random(2) * 100).tolist())
+    string_list_attribute = factory.LazyFunction(lambda: _words(2))
+
+    @classmethod
+    def _build(cls, model_class, *args, **kwargs):
+        # the generated values are known to be valid, so skip pydantic validation
+        return model_class.model_construct(**kwargs)
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        return cls._build(model_class, *args, **kwargs)
+
+    @classmethod
+    def _build_batch_extra_fields(cls, n: int) -> dict[str, list]:
+        # per-instance values of fields that subclasses add to the base model
+        return {}
+
+    @classmethod
+    def build_batch_vectorized(cls, n: int) -> list[MockBaseDataModel]:
+        """
+        Builds `n` models like `build_batch`, drawing each kind of random value for
+        the whole batch in one call instead of once per field and instance.
+        """
+        ints = _RNG.integers(1, 101, (n, 8))
+        small_ints = _RNG.integers(0, 51, n).tolist()
+        floats = _RNG.random((n, 3)) * 100
+        words = _words(3 * n)
+        extra_fields = cls._build_batch_extra_fields(n)
+        model_class = cls._meta.model
+        return [
+            model_class.model_construct(
+                required_integer_attribute=int(ints[i, 0]),
+                required_integer_list_attribute=ints[i, 1:4].tolist(),
+                integer_attribute=small_ints[i],
+                float_attribute=float(floats[i, 0]),
+                string_attribute=words[3 * i],
+                list_attribute=ints[i, 4:6].tolist(),
+                integer_list_attribute=ints[i, 6:8].tolist(),
+                float_list_attribute=floats[i, 1:3].tolist(),
+                string_list_attribute=words[3 * i + 1 : 3 * i + 3],
+                **{name: values[i] for name, values in extra_fields.items()},
+            )
+            for i in range(n)
+        ]
 
 
 class MockDataModelChildFactory(MockBaseDataModelFactory):
@@ -68,3 +119,11 @@ class MockDataModelParentFactory(MockBaseDataModelFactory):
         model = MockDataModelParent
 
     example_data_model_child = factory.SubFactory(MockDataModelChildFactory)
+
+    @classmethod
+    def _build_batch_extra_fields(cls, n: int) -> dict[str, list]:
+        return {
+            "example_data_model_child": MockDataModelChildFactory.build_batch_vectorized(
+                n
+            )
+        }
@@ -0,0 +1,26 @@
+class MockPayloads:
+    """
+    Encoded payloads served by the mocked downloads. Each payload is built on first
+    use and kept for the session, so every xdist worker only encodes the payloads
+    that its own tests request.
+    """
+
+    def __init__(self) -> None:
+        self._images: dict[tuple[str, tuple[int, int]], bytes] = {}
+        self._hocr: bytes | None = None
+
+    def image(self, mode: str = "RGB", size: tuple[int, int] = (100, 100)) -> bytes:
+        if (mode, size) not in self._images:
+            from PIL import Image as PILImageModule
+
+            from atria_core.utilities.encoding import _image_to_bytes
+
+            self._images[(mode, size)] = _image_to_bytes(PILImageModule.new(mode, size))
+        return self._images[(mode, size)]
+
+    def hocr(self) -> bytes:
+        if self._hocr is None:
+            from atria_core.types.factory import MOCK_HOCR_TESSERACT
+
+            self._hocr = MOCK_HOCR_TESSERACT.encode("utf-8")
+        return self._hocr
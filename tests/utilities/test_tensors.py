@@ -1,119 +1,281 @@
+import sys
+import warnings
+from functools import partial
+
 import numpy as np
+import pytest
 import torch
+from PIL import Image as PILImageModule
+from torchvision.transforms.functional import to_tensor
 
-from atria_core.utilities.tensors import _convert_to_tensor
+from atria_core.utilities import tensors
+from atria_core.utilities.tensors import _convert_to_tensor, _pil_image_to_tensor
 
+# exact comparison that also pins dtypes, which torch.equal ignores
+_assert_exact = partial(
+    torch.testing.assert_close, rtol=0, atol=0, check_dtype=True, check_stride=False
+)
 
-def test_convert_list_of_numbers():
-    """Test conversion of a list of numbers to a tensor."""
-    result = _convert_to_tensor([1, 2, 3])
-    assert isinstance(result, torch.Tensor)
-    assert torch.equal(result, torch.tensor([1, 2, 3]))
 
+# expected tensors shared by several tests, built once at import
+EXPECTED_1 = torch.tensor([1])
+EXPECTED_12 = torch.tensor([1, 2])
+EXPECTED_345 = torch.tensor([3, 4, 5])
+
+CASES = [
+    pytest.param([1, 2, 3], torch.tensor([1, 2, 3]), id="list_of_numbers"),
+    pytest.param(5, torch.tensor(5), id="single_number"),
+    pytest.param(
+        [torch.tensor([1, 2]), torch.tensor([3, 4])],
+        torch.tensor([[1, 2], [3, 4]]),
+        id="list_of_tensors",
+    ),
+    pytest.param(
+        [np.array([1, 2]), np.array([3, 4])],
+        torch.tensor([[1, 2], [3, 4]]),
+        id="list_of_numpy_arrays",
+    ),
+    pytest.param(
+        [np.array([1, 2]), np.array([0.5, 1.5])],
+        torch.tensor([[1.0, 2.0], [0.5, 1.5]], dtype=torch.float64),
+        id="list_of_mixed_dtype_numpy_arrays",
+    ),
+    pytest.param(
+        [np.array([0.5, 1.5], dtype=np.float32), np.array([2**40, 3])],
+        torch.tensor([[0.5, 1.5], [2**40, 3]], dtype=torch.float64),
+        id="list_of_float32_and_int64_numpy_arrays",
+    ),
+    pytest.param(np.array([1, 2, 3]), torch.tensor([1, 2, 3]), id="numpy_array"),
+    pytest.param(np.array(5), torch.tensor(5), id="zero_dim_numpy_array"),
+    pytest.param(
+        [[1, 2], [3, 4]], torch.tensor([[1, 2], [3, 4]]), id="nested_list_of_numbers"
+    ),
+    pytest.param(
+        [[torch.tensor([1, 2])], [torch.tensor([3, 4])]],
+        torch.tensor([[[1, 2]], [[3, 4]]]),
+        id="nested_list_of_tensors",
+    ),
+]
+
+# inputs that cannot be stacked, converted into (nested) lists of tensors
+RAGGED_CASES = [
+    pytest.param(
+        [np.array([1, 2]), np.array([3, 4, 5])],
+        [EXPECTED_12, EXPECTED_345],
+        id="list_of_variable_size_numpy_arrays",
+    ),
+    pytest.param(
+        [[1, 2], [3, 4, 5]],
+        [EXPECTED_12, EXPECTED_345],
+        id="nested_list_of_variable_size_numbers",
+    ),
+    pytest.param(
+        [torch.tensor([1, 2]), torch.tensor([3, 4, 5])],
+        [EXPECTED_12, EXPECTED_345],
+        id="list_of_variable_size_tensors",
+    ),
+    pytest.param(
+        [[torch.tensor([1, 2])], [torch.tensor([3, 4, 5])]],
+        [torch.tensor([[1, 2]]), torch.tensor([[3, 4, 5]])],
+        id="nested_list_of_variable_size_tensors",
+    ),
+    pytest.param(
+        [
+            [torch.tensor([1, 2]), torch.tensor([1, 2, 3])],
+            [torch.tensor([4, 5]), torch.tensor([6, 7, 8])],
+        ],
+        [
+            [torch.tensor([1, 2]), torch.tensor([1, 2, 3])],
+            [torch.tensor([4, 5]), torch.tensor([6, 7, 8])],
+        ],
+        id="doubly_nested_list_of_variable_size_tensors",
+    ),
+]
 
-def test_convert_single_number():
-    """Test conversion of a single number to a tensor."""
-    result = _convert_to_tensor(5)
-    assert isinstance(result, torch.Tensor)
-    assert torch.equal(result, torch.tensor(5))
 
+def _assert_nested_exact(result, expected):
+    if isinstance(expected, list):
+        assert isinstance(result, list)
+        for item, expected_item in zip(result, expected, strict=True):
+            _assert_nested_exact(item, expected_item)
+    else:
+        assert isinstance(result, torch.Tensor)
+        _assert_exact(result, expected)
 
-def test_convert_list_of_tensors():
-    """Test conversion of a list of tensors to a stacked tensor."""
-    tensors = [torch.tensor([1, 2]), torch.tensor([3, 4])]
+
+@pytest.mark.parametrize("value,expected", CASES)
+def test_convert_to_tensor(value, expected):
+    """Test conversion of stackable inputs to a single tensor."""
+    _assert_nested_exact(_convert_to_tensor(value), expected)
+
+
+@pytest.mark.parametrize("value,expected", RAGGED_CASES)
+def test_convert_ragged_to_tensor_list(value, expected):
+    """Test conversion of ragged inputs to lists of tensors."""
+    _assert_nested_exact(_convert_to_tensor(value), expected)
+
+
+@pytest.mark.parametrize(
+    "value", [5, 2.5, True, [1, 2], [0.5, 1.5], [True, False], [1, 2.5], [True, 1]]
+)
+def test_convert_python_scalars_match_torch_tensor(value):
+    """Test that python scalars and lists of them get torch's inferred dtype."""
+    _assert_exact(_convert_to_tensor(value), torch.tensor(value))
+
+
+def test_convert_list_of_tensors_requiring_grad():
+    """Test that stacking tensors that require grad keeps the autograd graph."""
+    tensors = [torch.ones(2, requires_grad=True), torch.zeros(2, requires_grad=True)]
     result = _convert_to_tensor(tensors)
     assert isinstance(result, torch.Tensor)
-    assert torch.equal(result, torch.stack(tensors))
+    assert result.requires_grad
+    _assert_exact(result, torch.stack(tensors))
 
 
-def test_convert_list_of_numpy_arrays():
-    """Test conversion of a list of NumPy arrays to a tensor."""
-    arrays = [np.array([1, 2]), np.array([3, 4])]
+def test_convert_list_of_numpy_arrays_parallel_copy(monkeypatch):
+    """Test that the threaded copy of large array batches gives the same result."""
+    monkeypatch.setattr(tensors, "_PARALLEL_COPY_MIN_BYTES", 0)
+    monkeypatch.setattr(tensors.os, "cpu_count", lambda: 4)
+    # a row count that does not split evenly across the workers
+    arrays = [np.full((3, 4), i, dtype=np.float32) for i in range(10)]
     result = _convert_to_tensor(arrays)
-    assert isinstance(result, torch.Tensor)
-    assert torch.equal(result, torch.tensor([[1, 2], [3, 4]]))
+    _assert_exact(result, torch.from_numpy(np.stack(arrays)))
+    ragged = _convert_to_tensor([*arrays, np.zeros((3, 5), dtype=np.float32)])
+    assert isinstance(ragged, list) and len(ragged) == 11
 
 
-def test_convert_single_numpy_array():
-    """Test conversion of a single NumPy array to a tensor."""
-    array = np.array([1, 2, 3])
-    result = _convert_to_tensor(array)
-    assert isinstance(result, torch.Tensor)
-    assert torch.equal(result, torch.tensor([1, 2, 3]))
+def test_convert_byte_swapped_numpy_arrays():
+    """Test that arrays in non-native byte order are converted."""
+    array = np.arange(3, dtype=np.dtype(np.float32).newbyteorder("S"))
+    expected = torch.tensor([0.0, 1.0, 2.0])
+    _assert_exact(_convert_to_tensor(array), expected)
+    _assert_exact(_convert_to_tensor([array, array]), torch.stack([expected] * 2))
 
 
-def test_convert_list_of_strings():
-    """Test that a list of strings remains unchanged."""
-    result = _convert_to_tensor(["a", "b", "c"])
-    assert isinstance(result, list)
-    assert result == ["a", "b", "c"]
+def test_convert_unsupported_numpy_dtype():
+    """Test that arrays of dtypes torch does not support are returned unchanged."""
+    array = np.array(["a", "b"])
+    assert _convert_to_tensor(array) is array
 
 
-def test_convert_nested_list_of_numbers():
-    """Test conversion of a nested list of numbers to tensors."""
-    result = _convert_to_tensor([[1, 2], [3, 4]])
-    assert isinstance(result, torch.Tensor)
-    assert torch.equal(result, torch.tensor([[1, 2], [3, 4]]))
+def test_convert_single_numpy_array_shares_memory():
+    """Test that a contiguous NumPy array is converted without a copy."""
+    array = np.array([1, 2, 3])
+    result = _convert_to_tensor(array)
+    result[0] = 10
+    assert array[0] == 10
 
 
-def test_convert_nested_list_of_numbers_var():
-    """Test conversion of a nested list of numbers to tensors."""
-    result = _convert_to_tensor([[1, 2], [3, 4, 5]])
-    assert isinstance(result, list)
-    assert isinstance(result[0], torch.Tensor)
-    assert isinstance(result[1], torch.Tensor)
-    assert torch.equal(result[0], torch.tensor([1, 2]))
-    assert torch.equal(result[1], torch.tensor([3, 4, 5]))
+def test_convert_read_only_memmap(tmp_path):
+    """Test that a read-only memory map is copied into a writable tensor."""
+    path = tmp_path / "array.npy"
+    np.save(path, np.arange(6, dtype=np.int64).reshape(2, 3))
+    array = np.load(path, mmap_mode="r")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = _convert_to_tensor(array)
+    _assert_exact(result, torch.arange(6).reshape(2, 3))
+    result[0, 0] = 10
+    assert array[0, 0] == 0
 
 
-def test_convert_nested_list_of_tensors():
-    """Test conversion of a nested list of tensors to tensors."""
-    result = _convert_to_tensor([[torch.tensor([1, 2])], [torch.tensor([3, 4])]])
-    assert isinstance(result, torch.Tensor)
-    assert torch.equal(result, torch.tensor([[[1, 2]], [[3, 4]]]))
+def test_convert_list_of_strings():
+    """Test that lists of strings or bytes are returned unchanged."""
+    value = ["a", "b", "c"]
+    assert _convert_to_tensor(value) is value
+    value = [b"a", b"b"]
+    assert _convert_to_tensor(value) is value
 
 
-def test_convert_nested_list_of_varible_size_tensors1():
-    """Test conversion of a nested list of tensors to tensors."""
-    result = _convert_to_tensor([torch.tensor([1, 2]), torch.tensor([3, 4, 5])])
-    assert isinstance(result, list)
-    assert isinstance(result[0], torch.Tensor)
-    assert isinstance(result[1], torch.Tensor)
-    assert torch.equal(result[0], torch.tensor([1, 2]))
-    assert torch.equal(result[1], torch.tensor([3, 4, 5]))
+def test_convert_nested_list_of_numbers_var_shares_storage():
+    """Test that ragged rows of numbers are views of a single allocation."""
+    result = _convert_to_tensor([[1, 2], [3, 4, 5], [6]])
+    storages = {row.untyped_storage().data_ptr() for row in result}
+    assert len(storages) == 1
+    assert [row.tolist() for row in result] == [[1, 2], [3, 4, 5], [6]]
 
 
-def test_convert_nested_list_of_varible_size_tensors2():
-    """Test conversion of a nested list of tensors to tensors."""
-    result = _convert_to_tensor([[torch.tensor([1, 2])], [torch.tensor([3, 4, 5])]])
-    assert isinstance(result, list)
-    assert isinstance(result[0], torch.Tensor)
-    assert isinstance(result[1], torch.Tensor)
-    assert torch.equal(result[0], torch.tensor([[1, 2]]))
-    assert torch.equal(result[1], torch.tensor([[3, 4, 5]]))
+@pytest.mark.parametrize("ragged", [False, True])
+def test_convert_long_list_of_numpy_arrays(ragged):
+    """Test conversion of a 10k element list of NumPy arrays."""
+    arrays = [np.full(2 + i % 2 if ragged else 2, i) for i in range(10_000)]
+    result = _convert_to_tensor(arrays)
+    if ragged:
+        assert isinstance(result, list)
+        for tensor, array in zip(result, arrays, strict=True):
+            _assert_exact(tensor, torch.from_numpy(array))
+    else:
+        _assert_exact(result, torch.from_numpy(np.stack(arrays)))
 
 
-def test_convert_nested_list_of_varible_size_tensors3():
-    """Test conversion of a nested list of tensors to tensors."""
-    result = _convert_to_tensor(
-        [
-            [torch.tensor([1, 2]), torch.tensor([1, 2, 3])],
-            [torch.tensor([4, 5]), torch.tensor([6, 7, 8])],
-        ]
-    )
-    assert isinstance(result, list)
-    assert isinstance(result[0], list)
-    assert isinstance(result[1], list)
-    assert torch.equal(result[0][0], torch.tensor([1, 2]))
-    assert torch.equal(result[0][1], torch.tensor([1, 2, 3]))
-    assert torch.equal(result[1][0], torch.tensor([4, 5]))
-    assert torch.equal(result[1][1], torch.tensor([6, 7, 8]))
+def test_convert_deeply_nested_list():
+    """Test that nesting deeper than the recursion limit is converted."""
+    value = [1]
+    for _ in range(sys.getrecursionlimit() + 100):
+        value = [value, [1, 2]]
+    result = _convert_to_tensor(value)
+    while isinstance(result[0], list):
+        _assert_exact(result[1], EXPECTED_12)
+        result = result[0]
+    _assert_exact(result[0], EXPECTED_1)
 
 
 def test_convert_list_with_empty_nested_list():
     """Test handling of a list containing an empty nested list."""
     assert _convert_to_tensor([]).shape == torch.Size([0])
     assert _convert_to_tensor([[]]).shape == torch.Size([1, 0])
+    assert _convert_to_tensor([[], []]).shape == torch.Size([2, 0])
     converted = _convert_to_tensor([[], [1, 2, 3]])
     assert converted[0].shape == torch.Size([0])
     assert converted[1].shape == torch.Size([3])
+
+
+# inputs of the dominant kinds converted during collation, built for a given length
+BENCHMARK_INPUTS = {
+    "ints": lambda size: list(range(size)),
+    "ndarrays": lambda size: [np.zeros(32, dtype=np.float32) for _ in range(size)],
+    "tensors": lambda size: [torch.zeros(32) for _ in range(size)],
+}
+
+
+@pytest.mark.benchmark(group="convert_to_tensor")
+@pytest.mark.parametrize("size", [1_000, 10_000])
+@pytest.mark.parametrize("kind", list(BENCHMARK_INPUTS))
+def test_bench_convert_to_tensor(benchmark, kind, size):
+    """Benchmark the conversion of long lists, run by scripts/bench.sh."""
+    value = BENCHMARK_INPUTS[kind](size)
+    result = benchmark(_convert_to_tensor, value)
+    assert isinstance(result, torch.Tensor)
+    assert result.shape[0] == size
+
+
+@pytest.fixture(params=[torch.float32, torch.float64, torch.float16, torch.bfloat16])
+def default_dtype(request):
+    default = torch.get_default_dtype()
+    torch.set_default_dtype(request.param)
+    yield request.param
+    torch.set_default_dtype(default)
+
+
+@pytest.mark.parametrize(
+    "value", [[0.5, 1.5], [[0.5, 1.5], [2.5, 3.5]], [[0.5], [1.5, 2.5]]]
+)
+def test_convert_floats_to_default_dtype(value, default_dtype):
+    """Test that python floats convert to the default dtype, as torch.tensor does."""
+    if isinstance(value[0], list) and len(value[0]) != len(value[1]):
+        expected = [torch.tensor(row) for row in value]
+    else:
+        expected = torch.tensor(value)
+    _assert_nested_exact(_convert_to_tensor(value), expected)
+
+
+@pytest.mark.parametrize("mode", ["1", "L", "P", "LA", "RGB", "RGBA", "CMYK", "I", "F"])
+def test_convert_pil_image_matches_torchvision(mode, default_dtype):
+    """Test that PIL images convert to the same tensor as torchvision's to_tensor."""
+    pixels = np.random.default_rng(0).integers(0, 256, (7, 5, 3), dtype=np.uint8)
+    image = PILImageModule.fromarray(pixels).convert(mode)
+    result = _pil_image_to_tensor(image)
+    assert result.is_contiguous()
+    assert result.dtype == to_tensor(image).dtype
+    _assert_exact(result, to_tensor(image))
+    _assert_exact(_convert_to_tensor(image), result)